@@ -13,12 +13,7 @@ Pictograms license: CC BY-NC-SA
 from typing import Any, Dict, List, Optional
 
 # Private
-from private import (
-    CardInterpreter,
-    CardRecommender,
-    ClusterSimilarityCalculator,
-    ConversationSummaryMemory,
-)
+from private import CardInterpreter, CardRecommender, ConversationSummaryMemory
 
 # Public
 from public import ContextManager, FeedbackManager, UserManager
@@ -78,10 +73,12 @@ class AACInterpreterService:
             # 카드 해석 시스템 초기화
             self.card_interpreter = CardInterpreter(config=self.config)
 
-            # 클러스터 유사도 계산기 초기화
-            self.cluster_calculator = ClusterSimilarityCalculator(
-                cluster_tags_path=self.config["cluster_tags_path"], config=self.config
-            )
+            # 클러스터 유사도 계산기 (카드 추천 시스템과 모델/임베딩 캐시 공유)
+            self.cluster_calculator = self.card_recommender.cluster_calculator
+
+            # 첫 요청 지연을 줄이기 위해 클러스터 태그 임베딩을 미리 구성
+            if self.config.get("warmup_tag_embeddings", True):
+                self.cluster_calculator.warmup()
         except Exception as e:
             print(f"컴포넌트 초기화 실패: {e}")
 
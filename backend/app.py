@@ -19,6 +19,7 @@ from typing import Any, Dict, Optional
 from aac_interpreter_service import AACInterpreterService
 from flask import Flask, jsonify, request, send_from_directory
 from flask_cors import CORS
+from private import card_display_name, parse_card_filename
 from service_config import SERVICE_CONFIG
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -529,16 +530,7 @@ def recommend_cards():
             # React 친화적 카드 데이터 포맷
             formatted_cards = []
             for i, card_filename in enumerate(cards):
-                card_id = (
-                    card_filename.split("_")[0]
-                    if "_" in card_filename
-                    else card_filename.replace(".png", "")
-                )
-                name_without_extension = card_filename.replace(".png", "")
-                if "_" in name_without_extension:
-                    card_name = "_".join(name_without_extension.split("_")[1:])
-                else:
-                    card_name = name_without_extension
+                card_id, card_name = parse_card_filename(card_filename)
 
                 formatted_cards.append(
                     {
@@ -641,16 +633,7 @@ def get_card_history_page(context_id, page_number):
 
             formatted_cards = []
             for i, card_filename in enumerate(cards):
-                card_id = (
-                    card_filename.split("_")[0]
-                    if "_" in card_filename
-                    else card_filename.replace(".png", "")
-                )
-                name_without_extension = card_filename.replace(".png", "")
-                if "_" in name_without_extension:
-                    card_name = "_".join(name_without_extension.split("_")[1:])
-                else:
-                    card_name = name_without_extension
+                card_id, card_name = parse_card_filename(card_filename)
 
                 formatted_cards.append(
                     {
@@ -798,7 +781,7 @@ def interpret_cards():
                     "selectedCards": [
                         {
                             "filename": filename,
-                            "name": filename.replace(".png", "").replace("_", " "),
+                            "name": card_display_name(filename),
                             "imagePath": f"/api/images/{filename}",
                         }
                         for filename in card_filenames
@@ -5,6 +5,7 @@ Private 모듈 - 내부 비즈니스 로직 및 데이터 처리 모듈들
 AI/ML 처리, 데이터 관리 등을 담당합니다.
 """
 
+from .card_filename import card_display_name, parse_card_filename
 from .card_interpreter import CardInterpreter
 from .card_recommender import CardRecommender
 from .cluster_similarity_calculator import ClusterSimilarityCalculator
@@ -17,4 +18,6 @@ __all__ = [
     "ConversationSummaryMemory",
     "ClusterSimilarityCalculator",
     "LLMFactory",
+    "parse_card_filename",
+    "card_display_name",
 ]
@@ -0,0 +1,44 @@
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=8192)
+def parse_card_filename(card_filename: str) -> Tuple[str, str]:
+    """카드 파일명에서 카드 ID와 카드 이름 추출.
+
+    파일명 패턴: {id}_{name}.png. 같은 카드 파일명이 페이지/세션마다 반복되므로
+    결과를 캐싱하여 요청마다 문자열 분리를 다시 하지 않습니다.
+
+    Args:
+        card_filename: 카드 파일명
+
+    Returns:
+        Tuple[str, str]: (카드_ID, 카드_이름)
+    """
+    name_without_extension = card_filename.replace(".png", "")
+
+    if "_" not in card_filename:
+        return name_without_extension, name_without_extension
+
+    card_id = card_filename.split("_")[0]
+    if "_" in name_without_extension:
+        card_name = name_without_extension.split("_", 1)[1]
+    else:
+        card_name = name_without_extension
+
+    return card_id, card_name
+
+
+@lru_cache(maxsize=8192)
+def card_display_name(card_filename: str) -> str:
+    """카드 파일명을 프롬프트/응답 표시용 이름으로 변환.
+
+    확장자를 제거하고 밑줄을 공백으로 바꾼 이름을 한 번만 계산하여 재사용합니다.
+
+    Args:
+        card_filename: 카드 파일명
+
+    Returns:
+        str: 표시용 카드 이름 (예: "123 사과")
+    """
+    return card_filename.replace(".png", "").replace("_", " ")
@@ -1,3 +1,9 @@
+import hashlib
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -13,7 +19,8 @@ class CardInterpreter:
     Attributes:
         config: 설정 딕셔너리
         llm_factory: OpenAI API 통합 관리 팩토리
-        feedback_counter: 피드백 ID 카운터
+        feedback_counter: 피드백 ID 카운터 (itertools.count)
+        interpretation_cache: 동일 입력에 대한 해석 결과 캐시 (LRU + TTL)
     """
 
     def __init__(self, config: Optional[Dict] = None):
@@ -22,8 +29,17 @@ class CardInterpreter:
         Args:
             config: 설정 딕셔너리.
         """
-        self.config = config
-        self.feedback_counter = 100000
+        self.config = config or {}
+        self.feedback_counter = itertools.count(100001)
+
+        # 해석 결과 캐시 (키: 입력 해시, 값: (저장 시각, 해석 리스트))
+        self.interpretation_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_size = self.config.get("interpretation_cache_size", 256)
+        self._cache_ttl = self.config.get("interpretation_cache_ttl", 600)
+
+        # 진행 중인 해석 요청 (키: 입력 해시, 값: 완료 이벤트)
+        self._inflight_requests = {}
 
         try:
             # LLM 팩토리 설정 구성
@@ -35,6 +51,7 @@ class CardInterpreter:
                 ),
                 "summary_max_tokens": self.config.get("summary_max_tokens"),
                 "api_timeout": self.config.get("api_timeout"),
+                "llm_max_concurrency": self.config.get("llm_max_concurrency"),
                 "images_folder": self.config.get("images_folder"),
             }
 
@@ -89,13 +106,20 @@ class CardInterpreter:
             disability_type = persona.get("disability_type", "알 수 없음")
             place = context.get("place", "알 수 없는 장소")
 
-            # LLM 팩토리를 통한 카드 해석 생성
-            interpretations = self.llm_factory.generate_card_interpretations(
+            # 동일 입력의 해석 결과가 캐시에 있으면 재사용
+            cache_key = self._make_cache_key(
                 persona, context, cards, past_interpretation
             )
+            interpretations = self._get_cached_interpretations(cache_key)
+
+            if interpretations is None:
+                # LLM 팩토리를 통한 카드 해석 생성 (동일 요청 동시 실행시 1회만 호출)
+                interpretations = self._generate_interpretations_once(
+                    cache_key, persona, context, cards, past_interpretation
+                )
 
             # 피드백 ID 생성
-            self.feedback_counter += 1
+            next(self.feedback_counter)
 
             memory_info = " (과거 해석 패턴 반영)" if past_interpretation else ""
 
@@ -124,3 +148,121 @@ class CardInterpreter:
                 "timestamp": timestamp,
                 "message": f"카드 해석 처리 중 시스템 오류가 발생했습니다: {str(e)}",
             }
+
+    def _generate_interpretations_once(
+        self,
+        cache_key: str,
+        persona: Dict[str, Any],
+        context: Dict[str, Any],
+        cards: List[str],
+        past_interpretation: str,
+    ) -> List[str]:
+        """동일 입력의 동시 요청을 하나의 LLM 호출로 합쳐 해석 생성.
+
+        같은 캐시 키로 이미 진행 중인 요청이 있으면 그 결과가 캐시에 저장될 때까지
+        기다렸다가 재사용합니다. 선행 요청이 실패하거나 시간 초과되면 직접 호출합니다.
+
+        Args:
+            cache_key: 캐시 키
+            persona: 사용자 페르소나 정보
+            context: 현재 상황 정보
+            cards: 선택된 카드 파일명 리스트
+            past_interpretation: 과거 해석 이력 요약
+
+        Returns:
+            List[str]: 생성된 해석 리스트
+
+        Raises:
+            ValueError: 해석 생성 실패시
+            Exception: API 호출 실패시
+        """
+        with self._cache_lock:
+            inflight_event = self._inflight_requests.get(cache_key)
+            is_leader = inflight_event is None
+            if is_leader:
+                inflight_event = threading.Event()
+                self._inflight_requests[cache_key] = inflight_event
+
+        if not is_leader:
+            inflight_event.wait(timeout=self.config.get("api_timeout", 15))
+
+        try:
+            # 대기 중 또는 캐시 조회 이후 다른 요청이 완료했을 수 있으므로 다시 확인
+            interpretations = self._get_cached_interpretations(cache_key)
+            if interpretations is None:
+                interpretations = self.llm_factory.generate_card_interpretations(
+                    persona, context, cards, past_interpretation
+                )
+                self._set_cached_interpretations(cache_key, interpretations)
+            return interpretations
+
+        finally:
+            if is_leader:
+                with self._cache_lock:
+                    self._inflight_requests.pop(cache_key, None)
+                inflight_event.set()
+
+    def _make_cache_key(
+        self,
+        persona: Dict[str, Any],
+        context: Dict[str, Any],
+        cards: List[str],
+        past_interpretation: str,
+    ) -> str:
+        """해석 입력 전체로부터 캐시 키 생성.
+
+        Args:
+            persona: 사용자 페르소나 정보
+            context: 현재 상황 정보
+            cards: 선택된 카드 파일명 리스트
+            past_interpretation: 과거 해석 이력 요약
+
+        Returns:
+            str: 입력을 직렬화한 SHA-256 해시
+        """
+        payload = json.dumps(
+            [persona, context, cards, past_interpretation],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_cached_interpretations(self, cache_key: str) -> Optional[List[str]]:
+        """캐시에서 만료되지 않은 해석 결과 조회.
+
+        Args:
+            cache_key: 캐시 키
+
+        Returns:
+            Optional[List[str]]: 캐시된 해석 리스트 (없거나 만료시 None)
+        """
+        with self._cache_lock:
+            entry = self.interpretation_cache.get(cache_key)
+            if entry is None:
+                return None
+
+            cached_at, interpretations = entry
+            if time.monotonic() - cached_at > self._cache_ttl:
+                del self.interpretation_cache[cache_key]
+                return None
+
+            self.interpretation_cache.move_to_end(cache_key)
+            return list(interpretations)
+
+    def _set_cached_interpretations(self, cache_key: str, interpretations: List[str]):
+        """해석 결과를 캐시에 저장하고 크기 제한을 초과하면 오래된 항목 제거.
+
+        Args:
+            cache_key: 캐시 키
+            interpretations: 저장할 해석 리스트
+        """
+        with self._cache_lock:
+            self.interpretation_cache[cache_key] = (
+                time.monotonic(),
+                tuple(interpretations),
+            )
+            self.interpretation_cache.move_to_end(cache_key)
+
+            while len(self.interpretation_cache) > self._cache_size:
+                self.interpretation_cache.popitem(last=False)
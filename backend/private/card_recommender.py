@@ -1,7 +1,12 @@
 import json
 import random
+import threading
+from collections import Counter, OrderedDict
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
 
 from .cluster_similarity_calculator import ClusterSimilarityCalculator
 
@@ -19,7 +24,9 @@ class CardRecommender:
         recommendation_history: 컨텍스트별 추천 히스토리
         cluster_calculator: 클러스터 유사도 계산기
         cluster_tags: 클러스터별 태그 정보
+        flat_cluster_tags: 유사도 검색용으로 펼친 전체 클러스터 태그 리스트
         n_clusters: 전체 클러스터 개수
+        cluster_match_cache: 키워드별 유사 클러스터 검색 결과 캐시 (LRU)
     """
 
     def __init__(self, clustering_results_path: str, config: Dict[str, Any]):
@@ -33,6 +40,9 @@ class CardRecommender:
         self.clustered_files = {}
         self.all_cards = []
         self.recommendation_history = {}
+        self.cluster_match_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_size = self.config.get("cluster_match_cache_size", 1024)
 
         # 클러스터 유사도 계산기 초기화
         self.cluster_calculator = ClusterSimilarityCalculator(
@@ -41,6 +51,7 @@ class CardRecommender:
 
         # 클러스터 태그 로드
         self._load_cluster_tags()
+        self._build_cluster_tag_index()
 
         # 클러스터링 결과 데이터 로드
         if Path(clustering_results_path).exists():
@@ -57,17 +68,29 @@ class CardRecommender:
             )
 
     def _load_cluster_tags(self):
-        """클러스터 태그 정보를 로드합니다."""
-        try:
-            cluster_tags_path = self.config.get("cluster_tags_path")
-            if Path(cluster_tags_path).exists():
-                with open(cluster_tags_path, "r", encoding="utf-8") as f:
-                    self.cluster_tags = {int(k): v for k, v in json.load(f).items()}
-            else:
-                self.cluster_tags = {}
-        except Exception as e:
-            print(f"클러스터 태그 로드 실패: {e}")
-            self.cluster_tags = {}
+        """클러스터 태그 정보를 로드합니다.
+
+        유사도 계산기가 이미 같은 태그 파일을 로드했으므로 그 데이터를 공유하여,
+        태그 순서가 계산기의 태그 임베딩 행렬 순서와 항상 일치하도록 합니다.
+        """
+        self.cluster_tags = self.cluster_calculator.cluster_tags
+
+    def _build_cluster_tag_index(self):
+        """유사도 검색용 클러스터 태그 인덱스를 한 번만 구성합니다.
+
+        모든 클러스터 태그를 클러스터 순서대로 하나의 리스트로 펼치고,
+        각 클러스터의 시작 위치(offset)를 기록해 요청마다 다시 만들지 않습니다.
+        """
+        self.flat_cluster_tags = []
+        self.tag_cluster_ids = []
+        self.tag_cluster_offsets = []
+
+        for cluster_id, cluster_tags in self.cluster_tags.items():
+            if not cluster_tags:
+                continue
+            self.tag_cluster_ids.append(cluster_id)
+            self.tag_cluster_offsets.append(len(self.flat_cluster_tags))
+            self.flat_cluster_tags.extend(cluster_tags)
 
     def get_card_selection_interface(
         self, persona: Dict[str, Any], context: Dict[str, Any], context_id: str
@@ -168,6 +191,10 @@ class CardRecommender:
         Returns:
             List[str]: 상황 기반 추천 카드 리스트
         """
+        # 선택할 카드가 없으면 유사도 계산 생략
+        if target_count <= 0:
+            return []
+
         # 현재 활동 상황 키워드로 사용
         activity = context.get("current_activity", "").strip()
 
@@ -207,6 +234,9 @@ class CardRecommender:
         Returns:
             List[str]: 페르소나 기반 추천 카드 리스트
         """
+        if target_count <= 0:
+            return []
+
         preferred_clusters = persona.get("preferred_category_types", [])
 
         if not preferred_clusters:
@@ -228,32 +258,56 @@ class CardRecommender:
         Returns:
             List[Tuple[int, float]]: (클러스터_ID, 유사도_점수) 리스트
         """
-        cluster_similarities = {}
+        # 같은 활동 키워드는 페이지/요청마다 반복되므로 검색 결과를 재사용
+        cache_key = (tuple(keywords), similarity_threshold, max_clusters)
+        with self._cache_lock:
+            cached_clusters = self.cluster_match_cache.get(cache_key)
+            if cached_clusters is not None:
+                self.cluster_match_cache.move_to_end(cache_key)
+                return list(cached_clusters)
+
+        all_tags = self.flat_cluster_tags
+        cluster_ids = self.tag_cluster_ids
+        cluster_offsets = self.tag_cluster_offsets
+
+        if not keywords or not all_tags:
+            return []
 
-        for cluster_id, cluster_tags in self.cluster_tags.items():
-            if not cluster_tags:
-                continue
+        # (키워드 수, 태그 수) 유사도 행렬을 한 번에 계산 (열 순서는 all_tags와 동일)
+        similarities = np.ascontiguousarray(
+            self.cluster_calculator.compute_cluster_tag_similarities(keywords)
+        )
 
-            # 클러스터 태그와 키워드 간 최대 유사도 계산
-            max_similarity = 0.0
-            for keyword in keywords:
-                for tag in cluster_tags:
-                    try:
-                        similarity = self.cluster_calculator.compute_topic_similarity(
-                            keyword, tag
-                        )
-                        max_similarity = max(max_similarity, similarity)
-                    except Exception:
-                        continue
-
-            if max_similarity >= similarity_threshold:
-                cluster_similarities[cluster_id] = max_similarity
-
-        # 유사도 순으로 정렬하여 상위 클러스터 반환
-        sorted_clusters = sorted(
-            cluster_similarities.items(), key=lambda x: x[1], reverse=True
+        # 키워드 축으로 최대값을 구한 뒤 클러스터 구간별 최대 유사도로 축약
+        tag_max_similarities = similarities.max(axis=0)
+        cluster_max_similarities = np.maximum.reduceat(
+            tag_max_similarities, cluster_offsets
         )
-        return sorted_clusters[:max_clusters]
+
+        # 임계값을 넘는 클러스터만 유사도 내림차순 정렬 (동점은 클러스터 순서 유지)
+        candidate_indices = np.flatnonzero(
+            cluster_max_similarities >= similarity_threshold
+        )
+        order = np.argsort(-cluster_max_similarities[candidate_indices], kind="stable")[
+            :max_clusters
+        ]
+        top_indices = candidate_indices[order]
+
+        # 상위 클러스터만 한 번에 파이썬 값으로 변환
+        sorted_clusters = list(
+            zip(
+                [cluster_ids[i] for i in top_indices.tolist()],
+                cluster_max_similarities[top_indices].tolist(),
+            )
+        )
+
+        with self._cache_lock:
+            self.cluster_match_cache[cache_key] = sorted_clusters
+            self.cluster_match_cache.move_to_end(cache_key)
+            while len(self.cluster_match_cache) > self._cache_size:
+                self.cluster_match_cache.popitem(last=False)
+
+        return list(sorted_clusters)
 
     def _select_cards_from_clusters(
         self, cluster_scores: List[Tuple[int, float]], target_count: int
@@ -271,24 +325,37 @@ class CardRecommender:
             return []
 
         selected_cards = []
-        total_score = sum(score for _, score in cluster_scores)
+        selected_set = set()
 
-        for cluster_id, score in cluster_scores:
+        # 점수 비례 카드 수를 클러스터 전체에 대해 한 번에 계산
+        scores = np.fromiter(
+            (score for _, score in cluster_scores),
+            dtype=np.float64,
+            count=len(cluster_scores),
+        )
+        card_quotas = np.maximum(
+            1, (scores / scores.sum() * target_count).astype(np.int64)
+        ).tolist()
+
+        for (cluster_id, _), cards_from_cluster in zip(cluster_scores, card_quotas):
             cluster_cards = self.clustered_files.get(cluster_id, [])
             if not cluster_cards:
                 continue
 
-            # 점수 비례 카드 수 계산
-            cards_from_cluster = max(1, int((score / total_score) * target_count))
             cards_from_cluster = min(cards_from_cluster, len(cluster_cards))
 
             # 클러스터에서 랜덤 선택
             available_cards = [
-                card for card in cluster_cards if card not in selected_cards
+                card for card in cluster_cards if card not in selected_set
             ]
-            if available_cards:
-                selected_count = min(cards_from_cluster, len(available_cards))
-                selected_cards.extend(random.sample(available_cards, selected_count))
+            if len(available_cards) <= cards_from_cluster:
+                # 후보가 필요한 수 이하이면 샘플링 없이 모두 선택
+                chosen_cards = available_cards
+            else:
+                chosen_cards = random.sample(available_cards, cards_from_cluster)
+
+            selected_cards.extend(chosen_cards)
+            selected_set.update(chosen_cards)
 
             if len(selected_cards) >= target_count:
                 break
@@ -308,26 +375,16 @@ class CardRecommender:
         Returns:
             List[str]: 최종 카드 리스트
         """
-        combined_cards = []
-        used_cards = set()
-
-        # 중복 제거하면서 추가
-        for card in context_cards:
-            if card not in used_cards and len(combined_cards) < total_count:
-                combined_cards.append(card)
-                used_cards.add(card)
-
-        for card in persona_cards:
-            if card not in used_cards and len(combined_cards) < total_count:
-                combined_cards.append(card)
-                used_cards.add(card)
+        # 순서를 유지하며 중복 제거 (상황 카드 우선, dict.fromkeys로 한 번에 처리)
+        combined_cards = list(dict.fromkeys(chain(context_cards, persona_cards)))[
+            :total_count
+        ]
+        used_cards = set(combined_cards)
 
         # 부족한 카드 수만큼 랜덤 카드 추가
         remaining_count = total_count - len(combined_cards)
         if remaining_count > 0:
-            additional_cards = self._select_random_cards(
-                list(used_cards), remaining_count
-            )
+            additional_cards = self._select_random_cards(used_cards, remaining_count)
             combined_cards.extend(additional_cards)
 
         return combined_cards[:total_count]
@@ -344,39 +401,36 @@ class CardRecommender:
         Returns:
             List[str]: 선택된 카드 파일명들
         """
-        selected_cards = []
-
         if not preferred_clusters:
             return self._select_random_cards([], num_cards)
 
-        # 각 클러스터에서 순환하면서 카드 선택
+        # 순환 선택 순서를 먼저 정해 클러스터별로 필요한 카드 수 계산
+        remaining_counts = {
+            cluster_id: len(self.clustered_files.get(cluster_id, []))
+            for cluster_id in preferred_clusters
+        }
+        pick_order = []
         cluster_index = 0
-        cards_per_cluster = {cluster_id: 0 for cluster_id in preferred_clusters}
 
-        while len(selected_cards) < num_cards and cluster_index < self.n_clusters:
+        while len(pick_order) < num_cards and cluster_index < self.n_clusters:
             cluster_id = preferred_clusters[cluster_index % len(preferred_clusters)]
-            cluster_cards = self.clustered_files.get(cluster_id, [])
 
-            if not cluster_cards:
-                cluster_index += 1
-                continue
-
-            # 이미 선택된 카드와 중복되지 않는 카드 찾기
-            available_cards = [
-                card for card in cluster_cards if card not in selected_cards
-            ]
-
-            if available_cards:
-                selected_card = random.choice(available_cards)
-                selected_cards.append(selected_card)
-                cards_per_cluster[cluster_id] += 1
+            if remaining_counts[cluster_id] > 0:
+                pick_order.append(cluster_id)
+                remaining_counts[cluster_id] -= 1
 
             cluster_index += 1
 
-        return selected_cards
+        # 클러스터별로 한 번에 샘플링한 뒤 순환 순서대로 배치
+        sampled_cards = {
+            cluster_id: iter(random.sample(self.clustered_files[cluster_id], count))
+            for cluster_id, count in Counter(pick_order).items()
+        }
+
+        return [next(sampled_cards[cluster_id]) for cluster_id in pick_order]
 
     def _select_random_cards(
-        self, exclude_cards: List[str], num_cards: int
+        self, exclude_cards: Iterable[str], num_cards: int
     ) -> List[str]:
         """전체 카드에서 랜덤으로 선택합니다.
 
@@ -387,7 +441,20 @@ class CardRecommender:
         Returns:
             List[str]: 선택된 랜덤 카드들
         """
-        available_cards = [card for card in self.all_cards if card not in exclude_cards]
+        exclude_set = (
+            exclude_cards if isinstance(exclude_cards, set) else set(exclude_cards)
+        )
+
+        # 제외 카드 수만큼 여유를 두고 먼저 샘플링하면 전체 카드를 훑지 않아도 됨
+        # (무작위 순서에서 제외 카드를 건너뛴 앞쪽 num_cards개이므로 균등 추출 유지)
+        sample_size = num_cards + len(exclude_set)
+        if sample_size < len(self.all_cards):
+            sampled_cards = random.sample(self.all_cards, sample_size)
+            return [card for card in sampled_cards if card not in exclude_set][
+                :num_cards
+            ]
+
+        available_cards = [card for card in self.all_cards if card not in exclude_set]
 
         if len(available_cards) <= num_cards:
             return available_cards
@@ -395,13 +462,13 @@ class CardRecommender:
         return random.sample(available_cards, num_cards)
 
     def validate_card_selection(
-        self, selected_cards: List[str], available_options: List[str]
+        self, selected_cards: List[str], available_options: Iterable[str]
     ) -> Dict[str, Any]:
         """사용자 카드 선택 유효성을 검증합니다.
 
         Args:
             selected_cards: 사용자가 선택한 카드들
-            available_options: 선택 가능한 카드 옵션들
+            available_options: 선택 가능한 카드 옵션들 (set/frozenset이면 그대로 사용)
 
         Returns:
             Dict containing:
@@ -450,10 +517,13 @@ class CardRecommender:
                 "message": "중복된 카드를 선택할 수 없습니다. 서로 다른 카드를 선택해주세요.",
             }
 
-        # 선택 가능한 옵션 내에서 선택했는지 검증
-        invalid_cards = [
-            card for card in selected_cards if card not in available_options
-        ]
+        # 선택 가능한 옵션 내에서 선택했는지 검증 (옵션 목록은 집합으로 한 번만 변환)
+        available_set = (
+            available_options
+            if isinstance(available_options, (set, frozenset))
+            else frozenset(available_options)
+        )
+        invalid_cards = [card for card in selected_cards if card not in available_set]
         if invalid_cards:
             return {
                 "status": "error",
@@ -602,16 +672,15 @@ class CardRecommender:
                 "message": f"컨텍스트 {context_id}의 첫 번째 카드 추천을 준비중입니다.",
             }
 
-        # 페이지별 요약 정보 생성
-        history_summary = []
-        for i, entry in enumerate(history):
-            history_summary.append(
-                {
-                    "page_number": i + 1,
-                    "card_count": len(entry["cards"]),
-                    "timestamp": entry["timestamp"],
-                }
-            )
+        # 페이지별 요약 정보 생성 (저장 시 기록한 페이지 번호/ISO 시각 재사용)
+        history_summary = [
+            {
+                "page_number": entry["page_number"],
+                "card_count": len(entry["cards"]),
+                "timestamp": entry["timestamp"],
+            }
+            for entry in history
+        ]
 
         return {
             "status": "success",
@@ -1,4 +1,8 @@
+import heapq
 import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -7,6 +11,23 @@ import torch
 from sentence_transformers import SentenceTransformer
 
 
+@lru_cache(maxsize=4)
+def load_similarity_model(model_name: str, device: str) -> SentenceTransformer:
+    """문장 임베딩 모델을 프로세스 단위로 한 번만 로드.
+
+    여러 컴포넌트가 ClusterSimilarityCalculator를 생성해도
+    같은 모델/디바이스 조합이면 이미 로드된 모델을 공유합니다.
+
+    Args:
+        model_name: 문장 임베딩 모델 이름
+        device: 연산 디바이스
+
+    Returns:
+        SentenceTransformer: 로드된 문장 임베딩 모델
+    """
+    return SentenceTransformer(model_name, device=device)
+
+
 class ClusterSimilarityCalculator:
     """클러스터 유사도 계산기.
 
@@ -18,6 +39,8 @@ class ClusterSimilarityCalculator:
         cluster_tags: 클러스터 ID별 태그 리스트
         device: 연산 디바이스
         config: 설정 딕셔너리
+        embedding_cache: 주제 문자열별 임베딩 캐시 (LRU)
+        all_cluster_topics: 전체 클러스터 태그를 클러스터 순서대로 펼친 리스트
     """
 
     def __init__(self, cluster_tags_path: str, config: Optional[Dict] = None):
@@ -33,6 +56,9 @@ class ClusterSimilarityCalculator:
         """
         self.config = config or {}
         self.cluster_tags = {}
+        self.embedding_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._tag_embeddings = None
 
         try:
             # 디바이스 설정
@@ -42,10 +68,10 @@ class ClusterSimilarityCalculator:
             else:
                 self.device = device_setting
 
-            # 문장 임베딩 모델 로드
+            # 문장 임베딩 모델 로드 (프로세스 내 공유)
             similarity_model_name = self.config.get("similarity_model")
-            self.similarity_model = SentenceTransformer(
-                similarity_model_name, device=self.device
+            self.similarity_model = load_similarity_model(
+                similarity_model_name, self.device
             )
 
             # 클러스터 태그 데이터 로드
@@ -75,6 +101,138 @@ class ClusterSimilarityCalculator:
         except Exception as e:
             raise FileNotFoundError(f"클러스터 태그 파일 로드 실패: {str(e)}")
 
+        # 모든 클러스터 태그를 하나의 리스트로 만들고 클러스터 매핑 정보 생성 (1회)
+        self.all_cluster_topics = []
+        self.cluster_topic_mapping = []
+        for cluster_id, cluster_topics in self.cluster_tags.items():
+            self.all_cluster_topics.extend(cluster_topics)
+            self.cluster_topic_mapping.extend([cluster_id] * len(cluster_topics))
+
+    def _encode_topics(self, topics: List[str]) -> torch.Tensor:
+        """주제 리스트 임베딩 (캐시 사용).
+
+        클러스터 태그나 사용자 관심 주제처럼 반복되는 문자열은 캐시된 임베딩을
+        재사용하고, 캐시에 없는 주제만 하나의 배치로 인코딩합니다.
+
+        Args:
+            topics: 인코딩할 주제 리스트
+
+        Returns:
+            torch.Tensor: (주제 수, 임베딩 차원) 임베딩 텐서
+        """
+        # 캐시에 있는 임베딩은 로컬 참조로 확보하고, 없는 주제만 모음
+        resolved = {}
+        with self._cache_lock:
+            for topic in dict.fromkeys(topics):
+                embedding = self.embedding_cache.get(topic)
+                if embedding is not None:
+                    resolved[topic] = embedding
+        missing_topics = [
+            topic for topic in dict.fromkeys(topics) if topic not in resolved
+        ]
+
+        # 모델 추론은 잠금 밖에서 수행하여 다른 요청을 막지 않음
+        if missing_topics:
+            new_embeddings = self.similarity_model.encode(
+                missing_topics,
+                batch_size=self.config.get("similarity_batch_size", 64),
+                convert_to_tensor=True,
+            )
+            resolved.update(zip(missing_topics, new_embeddings))
+
+        # 캐시 갱신 (최근 사용 순서 반영 및 크기 제한 초과분 제거)
+        with self._cache_lock:
+            for topic, embedding in resolved.items():
+                self.embedding_cache[topic] = embedding
+                self.embedding_cache.move_to_end(topic)
+
+            cache_size = self.config.get("embedding_cache_size", 4096)
+            while len(self.embedding_cache) > cache_size:
+                self.embedding_cache.popitem(last=False)
+
+        # 결과는 로컬 참조로 구성하므로 중간에 캐시 항목이 제거되어도 안전
+        embeddings = [resolved[topic] for topic in topics]
+
+        return torch.stack(embeddings)
+
+    def _get_tag_embeddings(self) -> torch.Tensor:
+        """전체 클러스터 태그 임베딩 행렬 반환 (최초 1회 구성).
+
+        클러스터 태그는 고정되어 있으므로 요청마다 캐시에서 태그 임베딩을
+        모아 쌓지 않고, 하나의 연속된 행렬로 만들어 재사용합니다.
+
+        GPU에서는 설정에 따라 float16으로 저장하여 메모리 대역폭을 절반으로 줄입니다.
+        (CPU의 float16 행렬 곱은 오히려 느리므로 float32 유지)
+
+        Returns:
+            torch.Tensor: (태그 수, 임베딩 차원) 임베딩 행렬
+        """
+        if self._tag_embeddings is None:
+            tag_embeddings = self._encode_topics(self.all_cluster_topics)
+            if self.device.startswith("cuda") and self.config.get(
+                "half_precision_tag_embeddings", False
+            ):
+                tag_embeddings = tag_embeddings.half()
+            self._tag_embeddings = tag_embeddings.contiguous()
+        return self._tag_embeddings
+
+    def warmup(self):
+        """서버 시작 시 클러스터 태그 임베딩 행렬을 미리 구성.
+
+        지연 구성 시 첫 사용자 요청이 전체 태그 인코딩 비용을 부담하므로,
+        서비스 초기화 단계에서 한 번 호출해 둡니다.
+        """
+        self._get_tag_embeddings()
+
+    @staticmethod
+    def _to_similarity_matrix(
+        embeddings1: torch.Tensor, embeddings2: torch.Tensor
+    ) -> np.ndarray:
+        """두 임베딩 행렬 간 유사도를 0~1 범위 행렬로 계산.
+
+        Args:
+            embeddings1: 첫 번째 임베딩 행렬
+            embeddings2: 두 번째 임베딩 행렬
+
+        Returns:
+            np.ndarray: 유사도 행렬 (0~1 범위)
+        """
+        similarities = torch.mm(embeddings1, embeddings2.T)
+
+        # -1~1 범위를 0~1 범위로 정규화
+        similarities = (similarities.float() + 1) / 2
+
+        return similarities.cpu().numpy()
+
+    def compute_cluster_tag_similarities(self, topics: List[str]) -> np.ndarray:
+        """주제 리스트와 전체 클러스터 태그 간의 유사도 계산.
+
+        열 순서는 all_cluster_topics와 같습니다.
+
+        Args:
+            topics: 주제 리스트
+
+        Returns:
+            np.ndarray: (주제 수, 태그 수) 유사도 행렬 (0~1 범위)
+
+        Raises:
+            ValueError: 입력이 비어있는 경우
+            RuntimeError: 유사도 계산 실패시
+        """
+        try:
+            if not topics or not self.all_cluster_topics:
+                raise ValueError("topics 또는 클러스터 태그가 비어 있습니다.")
+
+            tag_embeddings = self._get_tag_embeddings()
+            topic_embeddings = self._encode_topics(topics).to(tag_embeddings.dtype)
+
+            return self._to_similarity_matrix(topic_embeddings, tag_embeddings)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"클러스터 태그 유사도 계산 오류: {str(e)}")
+
     def compute_topic_similarities_batch(
         self, topics1: List[str], topics2: List[str]
     ) -> np.ndarray:
@@ -103,15 +261,12 @@ class ClusterSimilarityCalculator:
             if not topics1 or not topics2:
                 raise ValueError("topics1 또는 topics2가 비어 있습니다.")
 
-            # 임베딩 생성 및 유사도 계산
-            embeddings1 = self.similarity_model.encode(topics1, convert_to_tensor=True)
-            embeddings2 = self.similarity_model.encode(topics2, convert_to_tensor=True)
-            similarities = torch.mm(embeddings1, embeddings2.T)
-
-            # -1~1 범위를 0~1 범위로 정규화
-            similarities = (similarities + 1) / 2
+            # 두 리스트를 하나의 배치로 인코딩한 뒤 분리
+            embeddings = self._encode_topics(topics1 + topics2)
+            embeddings1 = embeddings[: len(topics1)]
+            embeddings2 = embeddings[len(topics1) :]
 
-            return similarities.cpu().numpy()
+            return self._to_similarity_matrix(embeddings1, embeddings2)
 
         except ValueError:
             raise
@@ -156,54 +311,50 @@ class ClusterSimilarityCalculator:
             RuntimeError: 계산 과정에서 오류 발생시
         """
         try:
-            # 모든 클러스터 태그를 하나의 리스트로 만들고 클러스터 매핑 정보 생성
-            all_cluster_topics = []
-            cluster_topic_mapping = []
-
-            for cluster_id, cluster_topics in self.cluster_tags.items():
-                for topic in cluster_topics:
-                    all_cluster_topics.append(topic)
-                    cluster_topic_mapping.append(cluster_id)
-
-            # 토픽들과 태그들 유사도 계산
-            similarities = self.compute_topic_similarities_batch(
-                interesting_topics, all_cluster_topics
-            )
+            # 토픽들과 태그들 유사도 계산 (태그 임베딩 행렬 재사용)
+            similarities = self.compute_cluster_tag_similarities(interesting_topics)
+
+            # 관심 주제 축으로 한 번에 축약하여 태그별 최대 유사도 계산
+            tag_max_similarities = similarities.max(axis=0).tolist()
 
             # 클러스터별 최대 유사도 계산
             cluster_max_similarities = {}
-            for i, cluster_id in enumerate(cluster_topic_mapping):
-                max_sim = float(similarities[:, i].max())
+            for cluster_id, max_sim in zip(
+                self.cluster_topic_mapping, tag_max_similarities
+            ):
                 if (
                     cluster_id not in cluster_max_similarities
                     or max_sim > cluster_max_similarities[cluster_id]
                 ):
                     cluster_max_similarities[cluster_id] = max_sim
 
-            # 임계값 이상의 클러스터 선택 및 유사도 순 정렬
-            candidates = [
-                (cluster_id, sim)
-                for cluster_id, sim in cluster_max_similarities.items()
-                if sim >= similarity_threshold
-            ]
-
-            candidates.sort(key=lambda x: x[1], reverse=True)
-            preferred_categories = [
-                cluster_id for cluster_id, _ in candidates[:max_categories]
-            ]
-
-            # 충분하지 않다면 유사도가 낮더라도 추가
-            if len(preferred_categories) < max_categories:
-                remaining_clusters = [
+            # 임계값 이상의 클러스터 중 유사도 상위 max_categories개만 부분 선택
+            candidates = heapq.nlargest(
+                max_categories,
+                (
                     (cluster_id, sim)
                     for cluster_id, sim in cluster_max_similarities.items()
-                    if cluster_id not in preferred_categories
-                ]
-                remaining_clusters.sort(key=lambda x: x[1], reverse=True)
+                    if sim >= similarity_threshold
+                ),
+                key=lambda x: x[1],
+            )
+            preferred_categories = [cluster_id for cluster_id, _ in candidates]
 
+            # 충분하지 않다면 유사도가 낮더라도 추가
+            if len(preferred_categories) < max_categories:
+                selected_clusters = set(preferred_categories)
                 needed_count = max_categories - len(preferred_categories)
+                remaining_clusters = heapq.nlargest(
+                    needed_count,
+                    (
+                        (cluster_id, sim)
+                        for cluster_id, sim in cluster_max_similarities.items()
+                        if cluster_id not in selected_clusters
+                    ),
+                    key=lambda x: x[1],
+                )
                 additional_clusters = [
-                    cluster_id for cluster_id, _ in remaining_clusters[:needed_count]
+                    cluster_id for cluster_id, _ in remaining_clusters
                 ]
                 preferred_categories.extend(additional_clusters)
 
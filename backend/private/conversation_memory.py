@@ -9,6 +9,7 @@ from langchain.memory import (
 )
 from langchain_openai import ChatOpenAI
 
+from .card_filename import card_display_name
 from .llm import LLMFactory
 
 load_dotenv()
@@ -40,8 +41,8 @@ class ConversationSummaryMemory:
         self.config = config
         self.memory_data = {"user_memories": {}}
 
-        # LangChain ChatOpenAI 모델 설정
-        self.model = self.config.get("openai_model")
+        # LangChain ChatOpenAI 모델 설정 (해석보다 단순한 요약 작업이므로 별도 모델 사용)
+        self.model = self.config.get("memory_model") or self.config.get("openai_model")
         self.temperature = self.config.get("openai_temperature")
         self.max_tokens = self.config.get("summary_max_tokens")
 
@@ -58,7 +59,9 @@ class ConversationSummaryMemory:
                 "openai_model": self.model,
                 "openai_temperature": 0.3,
                 "interpretation_max_tokens": 100,
+                "summary_max_tokens": self.max_tokens,
                 "api_timeout": self.config.get("api_timeout"),
+                "llm_max_concurrency": self.config.get("llm_max_concurrency"),
                 "images_folder": self.config.get("images_folder"),
             }
             self.llm_factory = LLMFactory(llm_config)
@@ -181,17 +184,25 @@ class ConversationSummaryMemory:
                 conversation_entry
             )
 
-            # 카드-해석 연결성 분석
-            connection_analysis = (
-                self.llm_factory.analyze_card_interpretation_connection(
-                    cards, context, final_interpretation
+            # 카드-해석 연결성 분석과 요약 갱신을 한 번의 호출로 수행
+            user_memory = self.memory_data["user_memories"][user_id]
+            try:
+                fused_result = self.llm_factory.analyze_connection_and_update_summary(
+                    cards, context, final_interpretation, user_memory.get("summary", "")
+                )
+                summary_result = fused_result["summary"]
+                user_memory["summary"] = summary_result
+
+            except ValueError:
+                # 통합 응답 파싱 실패시 기존 2단계 방식으로 처리
+                connection_analysis = (
+                    self.llm_factory.analyze_card_interpretation_connection(
+                        cards, context, final_interpretation
+                    )
+                )
+                summary_result = self._update_summary_with_langchain(
+                    user_id, connection_analysis
                 )
-            )
-
-            # LangChain ConversationSummaryMemory를 사용한 요약 생성
-            summary_result = self._update_summary_with_langchain(
-                user_id, connection_analysis
-            )
 
             # 메모리 저장
             self._save_memory()
@@ -253,10 +264,7 @@ class ConversationSummaryMemory:
             # 최근 대화 기록을 LangChain 형태로 변환하여 추가
             recent_conv = conversation_history[-1]  # 가장 최근 대화만
             cards_str = ", ".join(
-                [
-                    card.replace(".png", "").replace("_", " ")
-                    for card in recent_conv["cards"]
-                ]
+                [card_display_name(card) for card in recent_conv["cards"]]
             )
             context_str = f"{recent_conv['context'].get('place', '?')}에서 {recent_conv['context'].get('current_activity', '?')} 중"
 
@@ -1,14 +1,66 @@
 import base64
 import json
+import threading
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from ..card_filename import card_display_name
+
 load_dotenv()
 
 
+@lru_cache(maxsize=2048)
+def format_context_lines(
+    time: Optional[str],
+    place: Optional[str],
+    interaction_partner: Optional[str],
+    current_activity: Optional[str],
+) -> str:
+    """상황 정보를 프롬프트용 목록 문자열로 변환.
+
+    해석 프롬프트와 연결 분석 프롬프트가 같은 상황 블록을 사용하므로 한 곳에서
+    생성하고, 같은 세션에서 반복되는 상황 조합은 캐시된 문자열을 재사용합니다.
+
+    Args:
+        time: 시간
+        place: 장소
+        interaction_partner: 대화 상대
+        current_activity: 현재 활동
+
+    Returns:
+        str: "- 시간: ..." 형식의 상황 정보 문자열
+    """
+    return (
+        f"- 시간: {time}\n"
+        f"- 장소: {place}\n"
+        f"- 대화 상대: {interaction_partner}\n"
+        f"- 현재 활동: {current_activity}"
+    )
+
+
+@lru_cache(maxsize=64)
+def _encode_image_file(image_path: str, mtime_ns: int) -> str:
+    """이미지 파일을 base64로 인코딩 (경로·수정 시각 기준 캐시).
+
+    해석 생성과 대화 메모리 학습이 같은 카드 이미지를 연달아 보내므로 최근
+    인코딩 결과를 재사용합니다. 파일이 바뀌면 mtime_ns가 달라져 다시 인코딩합니다.
+
+    Args:
+        image_path: 이미지 파일 경로
+        mtime_ns: 파일 수정 시각 (나노초, 캐시 키 용도)
+
+    Returns:
+        str: base64 인코딩된 이미지 문자열
+    """
+    with open(image_path, "rb") as image_file:
+        return base64.b64encode(image_file.read()).decode("utf-8")
+
+
 class LLMFactory:
     """OpenAI API 통합 관리 팩토리.
 
@@ -20,10 +72,17 @@ class LLMFactory:
         model: 사용할 모델명
         temperature: 온도 설정
         max_tokens: 최대 토큰 수
+        summary_max_tokens: 대화 요약 최대 토큰 수
         timeout: API 호출 타임아웃
         images_folder: 이미지 폴더 경로
+        interpretation_system_prompts: 장애 유형별 해석 시스템 프롬프트
+        interpretation_user_template: 페르소나/상황 입력용 프롬프트 템플릿
+        request_semaphore: 프로세스 전체 동시 API 호출 수 제한 세마포어
     """
 
+    _request_semaphore = None
+    _semaphore_lock = threading.Lock()
+
     def __init__(self, config: Dict[str, Any]):
         """LLMFactory 초기화.
 
@@ -34,8 +93,150 @@ class LLMFactory:
         self.model = config.get("openai_model")
         self.temperature = config.get("openai_temperature")
         self.max_tokens = config.get("interpretation_max_tokens")
+        self.summary_max_tokens = config.get("summary_max_tokens") or 200
         self.timeout = config.get("api_timeout")
         self.images_folder = Path(config.get("images_folder"))
+        self.request_semaphore = self._get_request_semaphore(
+            config.get("llm_max_concurrency") or 8
+        )
+        self._build_interpretation_prompts()
+        self._build_response_schemas()
+
+    @classmethod
+    def _get_request_semaphore(cls, max_concurrency: int) -> threading.Semaphore:
+        """모든 LLMFactory 인스턴스가 공유하는 동시 호출 제한 세마포어 반환.
+
+        해석기와 대화 메모리가 각자 LLMFactory를 생성하므로 프로세스 단위로
+        하나의 세마포어를 공유해야 OpenAI 요청 한도(429) 초과를 막을 수 있습니다.
+
+        Args:
+            max_concurrency: 최대 동시 API 호출 수 (최초 생성시에만 적용)
+
+        Returns:
+            threading.Semaphore: 공유 세마포어
+        """
+        with cls._semaphore_lock:
+            if cls._request_semaphore is None:
+                cls._request_semaphore = threading.BoundedSemaphore(max_concurrency)
+            return cls._request_semaphore
+
+    def _build_interpretation_prompts(self):
+        """카드 해석용 정적 프롬프트를 한 번만 구성.
+
+        요청마다 바뀌지 않는 시스템 프롬프트와 해석 요청 문구는 미리 만들어 두고,
+        페르소나/상황 부분은 string.Template으로 값만 채워 넣습니다.
+        매 호출마다 같은 바이트열의 프리픽스가 만들어져 프롬프트 캐싱에도 유리합니다.
+        """
+        # 장애 유형별 시스템 프롬프트
+        disability_specific_prompts = {
+            "자폐스펙트럼장애": """당신은 AAC(보완대체의사소통) 해석 전문가입니다.
+현재 AAC 사용자는 자폐스펙트럼 장애를 가지고 있습니다. 자폐스펙트럼 장애의 특징으로는 반복하려는 경향, 특정 대상에 대한 강한 집착,
+비유적인 표현에 대한 이해 부족 등이 있습니다.""",
+            "지적장애": """당신은 AAC(보완대체의사소통) 해석 전문가입니다.
+현재 AAC 사용자는 지적장애를 가지고 있습니다. 지적장애의 특징으로는 지능지수가 IQ 70 이하로 낮고, 개인이 처해있는 환경과 그 연령에 따른
+자립성과 사회적 책임감의 기준에 미달하고, 사회적 상호작용 능력이 부족합니다.""",
+            "의사소통장애": """당신은 AAC(보완대체의사소통) 해석 전문가입니다.
+현재 AAC 사용자는 의사소통장애를 가지고 있습니다. 의사소통장애의 특징으로는 다른 사람의 말을 이해하는 능력은 비교적 정상이지만 간단한 단어나
+문장 표현을 어려워해 몸짓이나 손짓으로 대체하려 합니다. 자신의 생각을 언어로 표현하는 능력의 장애를 보입니다.""",
+        }
+
+        # 기본 해석 원칙 프롬프트
+        base_prompt = """사용자의 장애 유형의 특징, 페르소나, 상황을 고려해 선택된 AAC 카드 이미지들을 해석해주세요.
+
+해석 원칙:
+1. 선택된 이미지의 시각적 요소(객체, 행동, 표정, 색깔 등)를 고려하여 해석
+2. 사용자의 의도를 예상해 자연스러운 한국어로 표현
+3. 사용자의 페르소나(나이, 성별, 장애유형, 의사소통 특성)를 고려해 해석
+4. 상황 정보(시간, 장소, 대화 상대, 현재 활동)를 고려해 해석
+5. 과거 해석 패턴이 있다면 일관성을 유지해서 해석
+6. 해석 앞에 '첫 번째 해석:', '두 번째 해석:' 등의 접두사는 붙이지 말 것
+7. 해석에서 AAC 사용자의 명칭은 '소통이'로 통일할 것
+
+정확히 3개의 해석을 JSON 형식으로 생성해주세요. 각각 다른 관점에서 해석을 생성해 주세요.
+
+응답은 반드시 다음 JSON 형식으로만 제공해주세요:
+{
+  "interpretations": [
+    "첫 번째 해석 내용",
+    "두 번째 해석 내용",
+    "세 번째 해석 내용"
+  ]
+}"""
+
+        self.interpretation_base_prompt = base_prompt
+
+        # 모든 사용자에게 공통인 기본 프롬프트를 앞에 두어
+        # OpenAI 자동 프롬프트 캐싱의 공통 프리픽스를 최대화
+        self.interpretation_system_prompts = {
+            disability_type: f"{base_prompt}\n\n{disability_specific}"
+            for disability_type, disability_specific in (
+                disability_specific_prompts.items()
+            )
+        }
+
+        self.interpretation_user_template = Template(
+            """페르소나:
+- 나이: $age
+- 성별: $gender
+- 장애 유형: $disability_type
+- 의사소통 특성: $communication_characteristics
+- 관심 주제: $interesting_topics
+
+현재 상황:
+$context_lines
+
+$past_interpretation
+"""
+        )
+
+        self.interpretation_request_text = """
+위 이미지들을 보고 이 사용자가 전달하고자 하는 의도를 3가지 관점에서 해석해주세요.
+이미지의 시각적 내용과 순서를 반드시 고려하세요.
+
+응답은 반드시 다음 JSON 형식으로만 제공해주세요:
+{
+  "interpretations": [
+    "첫 번째 해석 내용",
+    "두 번째 해석 내용",
+    "세 번째 해석 내용"
+  ]
+}"""
+
+    def _build_response_schemas(self):
+        """Structured Outputs용 JSON 스키마 구성.
+
+        strict 모드 스키마를 지정하면 응답이 항상 스키마를 만족하므로
+        키 누락이나 형식 오류로 인한 재시도/폴백 호출이 줄어듭니다.
+        """
+        self.interpretation_schema = {
+            "name": "card_interpretations",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "interpretations": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    }
+                },
+                "required": ["interpretations"],
+                "additionalProperties": False,
+            },
+        }
+
+        self.memory_update_schema = {
+            "name": "conversation_memory_update",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "connection_analysis": {"type": "string"},
+                    "summary": {"type": "string"},
+                },
+                "required": ["connection_analysis", "summary"],
+                "additionalProperties": False,
+            },
+        }
 
     def encode_image(self, image_path: Path) -> str:
         """이미지를 base64로 인코딩.
@@ -46,14 +247,20 @@ class LLMFactory:
         Returns:
             str: base64 인코딩된 이미지 문자열
         """
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
+        image_path = Path(image_path)
+        return _encode_image_file(str(image_path), image_path.stat().st_mtime_ns)
 
-    def prepare_card_images_content(self, cards: List[str]) -> List[Dict[str, Any]]:
+    def prepare_card_images_content(
+        self, cards: List[str], detail: str = "high"
+    ) -> List[Dict[str, Any]]:
         """카드 이미지들을 OpenAI Vision API 형태로 준비.
 
+        파일 존재 여부를 따로 확인하지 않고 인코딩 시 stat 한 번으로 판단하여,
+        카드마다 파일 시스템 호출을 한 번만 수행합니다.
+
         Args:
             cards: 카드 파일명 리스트
+            detail: 이미지 분석 상세도 ("high" 또는 "low")
 
         Returns:
             List[Dict]: OpenAI Vision API 콘텐츠 형식
@@ -61,30 +268,30 @@ class LLMFactory:
         content = []
 
         for i, card_filename in enumerate(cards, 1):
-            image_path = self.images_folder / card_filename
-
-            if image_path.exists():
-                base64_image = self.encode_image(image_path)
-                content.extend(
-                    [
-                        {"type": "text", "text": f"\n카드 {i}:"},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{base64_image}",
-                                "detail": "high",
-                            },
-                        },
-                    ]
-                )
-            else:
-                keyword = card_filename.replace(".png", "").replace("_", " ")
+            try:
+                base64_image = self.encode_image(self.images_folder / card_filename)
+            except FileNotFoundError:
+                keyword = card_display_name(card_filename)
                 content.append(
                     {
                         "type": "text",
                         "text": f"\n카드 {i}: {keyword} (이미지 파일 없음)",
                     }
                 )
+                continue
+
+            content.extend(
+                [
+                    {"type": "text", "text": f"\n카드 {i}:"},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:image/png;base64,{base64_image}",
+                            "detail": detail,
+                        },
+                    },
+                ]
+            )
 
         return content
 
@@ -95,6 +302,8 @@ class LLMFactory:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         use_json_format: bool = False,
+        prompt_cache_key: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
     ) -> str:
         """OpenAI Vision API 호출.
 
@@ -104,6 +313,8 @@ class LLMFactory:
             temperature: 온도 설정 (선택사항)
             max_tokens: 최대 토큰 수 (선택사항)
             use_json_format: JSON 형식 응답 요청 여부
+            prompt_cache_key: 프롬프트 캐시 라우팅 키 (선택사항)
+            response_schema: strict JSON 스키마 (선택사항, 지정시 use_json_format보다 우선)
 
         Returns:
             str: API 응답 내용
@@ -124,11 +335,22 @@ class LLMFactory:
                 "timeout": self.timeout,
             }
 
-            # JSON 형식 요청시 response_format 추가
-            if use_json_format:
+            # 스키마 지정시 Structured Outputs, JSON 형식 요청시 JSON 모드 사용
+            if response_schema:
+                request_params["response_format"] = {
+                    "type": "json_schema",
+                    "json_schema": response_schema,
+                }
+            elif use_json_format:
                 request_params["response_format"] = {"type": "json_object"}
 
-            response = self.client.chat.completions.create(**request_params)
+            # 같은 정적 프리픽스를 가진 요청을 같은 프롬프트 캐시로 라우팅
+            if prompt_cache_key:
+                request_params["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+
+            # 동시 호출 수를 제한하여 요청 한도 초과와 재시도 폭주 방지
+            with self.request_semaphore:
+                response = self.client.chat.completions.create(**request_params)
             return response.choices[0].message.content.strip()
 
         except Exception as e:
@@ -208,73 +430,42 @@ class LLMFactory:
             Exception: API 호출 실패시
         """
         try:
-            # 장애 유형별 시스템 프롬프트
-            disability_specific_prompts = {
-                "자폐스펙트럼장애": """당신은 AAC(보완대체의사소통) 해석 전문가입니다.
-현재 AAC 사용자는 자폐스펙트럼 장애를 가지고 있습니다. 자폐스펙트럼 장애의 특징으로는 반복하려는 경향, 특정 대상에 대한 강한 집착,
-비유적인 표현에 대한 이해 부족 등이 있습니다.""",
-                "지적장애": """당신은 AAC(보완대체의사소통) 해석 전문가입니다.
-현재 AAC 사용자는 지적장애를 가지고 있습니다. 지적장애의 특징으로는 지능지수가 IQ 70 이하로 낮고, 개인이 처해있는 환경과 그 연령에 따른
-자립성과 사회적 책임감의 기준에 미달하고, 사회적 상호작용 능력이 부족합니다.""",
-                "의사소통장애": """당신은 AAC(보완대체의사소통) 해석 전문가입니다.
-현재 AAC 사용자는 의사소통장애를 가지고 있습니다. 의사소통장애의 특징으로는 다른 사람의 말을 이해하는 능력은 비교적 정상이지만 간단한 단어나
-문장 표현을 어려워해 몸짓이나 손짓으로 대체하려 합니다. 자신의 생각을 언어로 표현하는 능력의 장애를 보입니다.""",
-            }
-
-            # 기본 해석 원칙 프롬프트
-            base_prompt = """사용자의 장애 유형의 특징, 페르소나, 상황을 고려해 선택된 AAC 카드 이미지들을 해석해주세요.
-
-해석 원칙:
-1. 선택된 이미지의 시각적 요소(객체, 행동, 표정, 색깔 등)를 고려하여 해석
-2. 사용자의 의도를 예상해 자연스러운 한국어로 표현
-3. 사용자의 페르소나(나이, 성별, 장애유형, 의사소통 특성)를 고려해 해석
-4. 상황 정보(시간, 장소, 대화 상대, 현재 활동)를 고려해 해석
-5. 과거 해석 패턴이 있다면 일관성을 유지해서 해석
-6. 해석 앞에 '첫 번째 해석:', '두 번째 해석:' 등의 접두사는 붙이지 말 것
-7. 해석에서 AAC 사용자의 명칭은 '소통이'로 통일할 것
-
-정확히 3개의 해석을 JSON 형식으로 생성해주세요. 각각 다른 관점에서 해석을 생성해 주세요.
-
-응답은 반드시 다음 JSON 형식으로만 제공해주세요:
-{
-  "interpretations": [
-    "첫 번째 해석 내용",
-    "두 번째 해석 내용",
-    "세 번째 해석 내용"
-  ]
-}"""
-
-            # 장애 유형에 따른 시스템 프롬프트 구성
+            # 장애 유형에 따른 시스템 프롬프트 (초기화 시 미리 구성)
             disability_type = persona.get("disability_type")
-            disability_specific = disability_specific_prompts.get(disability_type, "")
-
-            if disability_specific:
-                system_prompt = f"{disability_specific}\n\n{base_prompt}"
-            else:
-                system_prompt = base_prompt
+            system_prompt = self.interpretation_system_prompts.get(
+                disability_type, self.interpretation_base_prompt
+            )
 
             # 이미지 콘텐츠 준비
             image_content = self.prepare_card_images_content(cards)
+            context_lines = format_context_lines(
+                context.get("time"),
+                context.get("place"),
+                context.get("interaction_partner"),
+                context.get("current_activity"),
+            )
 
             # 사용자 콘텐츠 구성
             user_content = [
                 {
                     "type": "text",
-                    "text": f"""페르소나:
-- 나이: {persona.get('age')}
-- 성별: {persona.get('gender')}
-- 장애 유형: {persona.get('disability_type')}
-- 의사소통 특성: {persona.get('communication_characteristics')}
-- 관심 주제: {', '.join(persona.get('interesting_topics', []))}
-
-현재 상황:
-- 시간: {context.get('time')}
-- 장소: {context.get('place')}
-- 대화 상대: {context.get('interaction_partner')}
-- 현재 활동: {context.get('current_activity')}
-
-{f"과거 해석 패턴: {past_interpretation}" if past_interpretation else ""}
-""",
+                    "text": self.interpretation_user_template.substitute(
+                        age=persona.get("age"),
+                        gender=persona.get("gender"),
+                        disability_type=disability_type,
+                        communication_characteristics=persona.get(
+                            "communication_characteristics"
+                        ),
+                        interesting_topics=", ".join(
+                            persona.get("interesting_topics", [])
+                        ),
+                        context_lines=context_lines,
+                        past_interpretation=(
+                            f"과거 해석 패턴: {past_interpretation}"
+                            if past_interpretation
+                            else ""
+                        ),
+                    ),
                 }
             ]
 
@@ -283,26 +474,15 @@ class LLMFactory:
 
             # 해석 요청 메시지 추가
             user_content.append(
-                {
-                    "type": "text",
-                    "text": """
-위 이미지들을 보고 이 사용자가 전달하고자 하는 의도를 3가지 관점에서 해석해주세요.
-이미지의 시각적 내용과 순서를 반드시 고려하세요.
-
-응답은 반드시 다음 JSON 형식으로만 제공해주세요:
-{
-  "interpretations": [
-    "첫 번째 해석 내용",
-    "두 번째 해석 내용",
-    "세 번째 해석 내용"
-  ]
-}""",
-                }
+                {"type": "text", "text": self.interpretation_request_text}
             )
 
             # API 호출 (JSON 형식 요청)
             content = self.call_vision_api(
-                system_prompt, user_content, use_json_format=True
+                system_prompt,
+                user_content,
+                prompt_cache_key=f"aac-interpret-v1-{disability_type}",
+                response_schema=self.interpretation_schema,
             )
 
             # JSON에서 해석 추출
@@ -313,6 +493,44 @@ class LLMFactory:
         except (ValueError, Exception) as e:
             raise e
 
+    def _build_connection_content(
+        self, cards: List[str], context: Dict[str, Any], final_interpretation: str
+    ) -> List[Dict[str, Any]]:
+        """카드-해석 연결성 분석용 공통 콘텐츠 구성.
+
+        Args:
+            cards: 선택된 카드 파일명 리스트
+            context: 상황 정보
+            final_interpretation: 최종 선택된 해석
+
+        Returns:
+            List[Dict]: 상황 정보, 최종 해석, 카드 이미지가 포함된 콘텐츠
+        """
+        context_lines = format_context_lines(
+            context.get("time", "알 수 없음"),
+            context.get("place", "알 수 없음"),
+            context.get("interaction_partner", "알 수 없음"),
+            context.get("current_activity", "알 수 없음"),
+        )
+        content = [
+            {
+                "type": "text",
+                "text": f"""다음 AAC 카드 이미지들을 보고, 주어진 상황에서 어떤 시각적 특징이 최종 해석으로 연결되었는지 분석해주세요.
+
+상황 정보:
+{context_lines}
+
+최종 해석: {final_interpretation}
+
+이미지들:""",
+            }
+        ]
+
+        # 각 카드 이미지 추가
+        content.extend(self.prepare_card_images_content(cards, detail="low"))
+
+        return content
+
     def analyze_card_interpretation_connection(
         self, cards: List[str], context: Dict[str, Any], final_interpretation: str
     ) -> str:
@@ -331,48 +549,9 @@ class LLMFactory:
         """
         try:
             # 분석 요청 콘텐츠 구성
-            content = [
-                {
-                    "type": "text",
-                    "text": f"""다음 AAC 카드 이미지들을 보고, 주어진 상황에서 어떤 시각적 특징이 최종 해석으로 연결되었는지 분석해주세요.
-
-상황 정보:
-- 시간: {context.get('time', '알 수 없음')}
-- 장소: {context.get('place', '알 수 없음')}
-- 대화 상대: {context.get('interaction_partner', '알 수 없음')}
-- 현재 활동: {context.get('current_activity', '알 수 없음')}
-
-최종 해석: {final_interpretation}
-
-이미지들:""",
-                }
-            ]
-
-            # 각 카드 이미지 추가
-            for i, card_filename in enumerate(cards, 1):
-                image_path = self.images_folder / card_filename
-
-                if image_path.exists():
-                    base64_image = self.encode_image(image_path)
-                    content.extend(
-                        [
-                            {"type": "text", "text": f"\n카드 {i}:"},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{base64_image}",
-                                    "detail": "low",
-                                },
-                            },
-                        ]
-                    )
-                else:
-                    content.append(
-                        {
-                            "type": "text",
-                            "text": f"\n카드 {i}: {card_filename} (이미지 파일 없음)",
-                        }
-                    )
+            content = self._build_connection_content(
+                cards, context, final_interpretation
+            )
 
             content.append(
                 {
@@ -385,3 +564,71 @@ class LLMFactory:
 
         except Exception as e:
             raise Exception(f"카드-해석 연결성 분석 실패: {str(e)}")
+
+    def analyze_connection_and_update_summary(
+        self,
+        cards: List[str],
+        context: Dict[str, Any],
+        final_interpretation: str,
+        existing_summary: str = "",
+    ) -> Dict[str, str]:
+        """카드-해석 연결성 분석과 대화 요약 갱신을 한 번의 API 호출로 수행.
+
+        연결성 분석과 요약 갱신은 같은 카드/상황/해석 정보를 사용하므로
+        하나의 JSON 응답으로 두 결과를 함께 받아 왕복 호출을 줄입니다.
+
+        Args:
+            cards: 선택된 카드 파일명 리스트
+            context: 상황 정보
+            final_interpretation: 최종 선택된 해석
+            existing_summary: 기존 대화 요약
+
+        Returns:
+            Dict containing:
+                - connection_analysis (str): 분석된 연결성 요약
+                - summary (str): 갱신된 대화 요약
+
+        Raises:
+            ValueError: JSON 파싱 또는 결과 추출 실패시
+            Exception: API 호출 실패시
+        """
+        content = self._build_connection_content(cards, context, final_interpretation)
+
+        content.append(
+            {
+                "type": "text",
+                "text": f"""
+기존 대화 요약: {existing_summary or "(없음)"}
+
+1. 위 이미지들의 어떤 시각적 요소(객체, 색깔, 행동, 표정 등)가 최종 해석으로 연결되었는지 50자 이내로 분석해주세요.
+2. 기존 대화 요약에 이번 대화(상황, 선택한 카드, 연결성 분석, 최종 해석)를 반영하여 새로운 누적 요약을 작성해주세요.
+
+응답은 반드시 다음 JSON 형식으로만 제공해주세요:
+{{
+  "connection_analysis": "연결성 분석 내용",
+  "summary": "갱신된 대화 요약"
+}}""",
+            }
+        )
+
+        response = self.call_vision_api(
+            "",
+            content,
+            temperature=0.3,
+            max_tokens=self.summary_max_tokens + 100,
+            response_schema=self.memory_update_schema,
+        )
+
+        try:
+            parsed_data = json.loads(response)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 파싱 실패: {str(e)}")
+
+        result = {}
+        for key in ("connection_analysis", "summary"):
+            value = parsed_data.get(key)
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"응답에서 '{key}' 값을 찾을 수 없습니다.")
+            result[key] = value.strip()
+
+        return result
@@ -1,3 +1,4 @@
+import itertools
 import json
 import os
 from datetime import datetime
@@ -13,8 +14,8 @@ class FeedbackManager:
     Attributes:
         feedback_file_path: 피드백 데이터 저장 파일 경로
         _data: 피드백 파일 데이터
-        _feedback_id_counter: 피드백 ID 생성 카운터
-        confirmation_counter: 확인 요청 ID 생성 카운터
+        _feedback_id_counter: 피드백 ID 생성 카운터 (itertools.count)
+        confirmation_counter: 확인 요청 ID 생성 카운터 (itertools.count)
         pending_confirmations: 대기 중인 파트너 확인 요청 딕셔너리
     """
 
@@ -26,11 +27,11 @@ class FeedbackManager:
         """
         self.feedback_file_path = feedback_file_path
         self._data = {"interpretations": [], "feedbacks": []}
-        self._feedback_id_counter = 1
+        self._feedback_id_counter = itertools.count(1)
 
         # Partner 피드백 관련 데이터
         self.pending_confirmations = {}
-        self.confirmation_counter = 1000000
+        self.confirmation_counter = itertools.count(1000000)
 
         # 기존 데이터 로드
         self._load_from_file()
@@ -57,8 +58,8 @@ class FeedbackManager:
 
             # 피드백 ID 카운터 설정
             if self._data.get("feedbacks"):
-                self._feedback_id_counter = (
-                    max([f["feedback_id"] for f in self._data["feedbacks"]]) + 1
+                self._feedback_id_counter = itertools.count(
+                    max(f["feedback_id"] for f in self._data["feedbacks"]) + 1
                 )
 
         except Exception as e:
@@ -117,8 +118,7 @@ class FeedbackManager:
 
         try:
             # 확인 요청 ID 생성
-            confirmation_id = str(self.confirmation_counter)
-            self.confirmation_counter += 1
+            confirmation_id = str(next(self.confirmation_counter))
 
             # 확인 요청 데이터 생성
             confirmation_request = {
@@ -299,8 +299,7 @@ class FeedbackManager:
         """
         try:
             # 피드백 ID 생성
-            feedback_id = self._feedback_id_counter
-            self._feedback_id_counter += 1
+            feedback_id = next(self._feedback_id_counter)
 
             # 해석 시도 기록 생성
             attempt_record = {
@@ -11,10 +11,14 @@ USER_DATA_ROOT = PROJECT_ROOT / "user_data"
 SERVICE_CONFIG = {
     # OpenAI API 설정
     "openai_model": "gpt-4o-2024-08-06",
+    # 대화 메모리(연결성 분석/요약)는 단순 요약 작업이므로 저비용 모델 사용
+    # 요약 품질이 부족하면 openai_model과 같은 모델로 변경
+    "memory_model": "gpt-4o-mini",
     "openai_temperature": 0.8,
     "interpretation_max_tokens": 400,
     "summary_max_tokens": 200,
     "api_timeout": 15,
+    "llm_max_concurrency": 8,  # 프로세스당 최대 동시 OpenAI 호출 수
     # 파일 경로
     "images_folder": str(DATASET_ROOT / "images"),
     "users_file_path": str(USER_DATA_ROOT / "users.json"),
@@ -33,10 +37,13 @@ SERVICE_CONFIG = {
     "persona_similarity_threshold": 0.3,
     "persona_max_clusters": 8,
     "context_persona_ratio": 0.5,  # 상황:페르소나 = 0.5:0.5
+    "cluster_match_cache_size": 1024,
     # 카드 선택 및 해석
     "min_card_selection": 1,
     "max_card_selection": 4,
     "interpretation_count": 3,
+    "interpretation_cache_size": 256,
+    "interpretation_cache_ttl": 600,  # 초
     # 시스템 성능
     "max_conversation_history": 50,
     "memory_pattern_limit": 5,
@@ -58,6 +65,10 @@ SERVICE_CONFIG = {
     # 클러스터 유사도 계산
     "similarity_model": "dragonkue/BGE-m3-ko",
     "similarity_threshold": 0.5,
+    "similarity_batch_size": 64,
+    "embedding_cache_size": 4096,
+    "half_precision_tag_embeddings": True,  # GPU에서만 적용
+    "warmup_tag_embeddings": True,  # 서비스 시작 시 태그 임베딩 미리 구성
     "device": "auto",
     # 데이터 정리
     "default_cleanup_days": 30,
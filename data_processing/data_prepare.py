@@ -144,12 +144,17 @@ def main() -> None:
     parser.add_argument("--no-confirm", action="store_true", help="확인 생략")
     parser.add_argument("--no-visualize", action="store_true", help="시각화 생략")
     parser.add_argument("--overwrite", action="store_true", help="기존 파일 덮어쓰기")
+    parser.add_argument(
+        "--batch-api", action="store_true", help="Batch API로 클러스터 태깅"
+    )
 
     args = parser.parse_args()
 
     config = DATASET_CONFIG.copy()
     if args.overwrite:
         config["overwrite_mode"] = True
+    if args.batch_api:
+        config["use_batch_api"] = True
 
     valid_steps = ["1", "2", "3", "4"]
     args.steps = [s for s in args.steps if s in valid_steps]
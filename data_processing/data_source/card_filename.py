@@ -0,0 +1,18 @@
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=16384)
+def extract_card_keyword(filename: str) -> str:
+    """카드 파일명에서 키워드 추출.
+
+    파일명 패턴: {id}_{keyword}.png에서 keyword 부분을 추출합니다.
+    필터링, 임베딩, 태깅 단계가 같은 파일명을 반복해서 처리하므로 결과를 캐싱합니다.
+
+    Args:
+        filename: 파일명
+
+    Returns:
+        str: 추출된 키워드 (없으면 빈 문자열)
+    """
+    return Path(filename).stem.partition("_")[2]
@@ -1,4 +1,5 @@
 import base64
+import heapq
 import json
 import time
 from pathlib import Path
@@ -9,9 +10,11 @@ import torch
 from dotenv import load_dotenv
 from openai import OpenAI
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics import pairwise_distances
 from tqdm import tqdm
 
+from .card_filename import extract_card_keyword
+from .embedding_store import load_fused_embeddings
+
 
 class ClusterTagger:
     """계층적 클러스터 태깅.
@@ -65,34 +68,19 @@ class ClusterTagger:
             embeddings_path: 임베딩 파일 경로
             clustering_results_path: 클러스터링 결과 파일 경로
         """
-        with open(embeddings_path, "r", encoding="utf-8") as f:
-            embedding_data = json.load(f)
-
         with open(clustering_results_path, "r", encoding="utf-8") as f:
             cluster_data = json.load(f)
 
-        self.filenames = embedding_data["filenames"]
-
-        # 임베딩 융합
-        img_embeddings = np.array(embedding_data["image_embeddings"])
-        txt_embeddings = np.array(embedding_data["text_embeddings"])
-
-        from sklearn.preprocessing import normalize
-
-        img_normalized = normalize(img_embeddings, norm="l2")
-        txt_normalized = normalize(txt_embeddings, norm="l2")
-
-        img_weight = self.config["image_weight"]
-        self.embeddings = (
-            img_weight * img_normalized + (1 - img_weight) * txt_normalized
+        # 임베딩 융합 (연속된 float32 행렬, 디스크 캐시 사용)
+        self.filenames, self.embeddings = load_fused_embeddings(
+            embeddings_path, self.config["image_weight"]
         )
-        self.embeddings = normalize(self.embeddings, norm="l2")
 
         self.cluster_labels = np.array(cluster_data["cluster_labels"])
         self.clustered_files = {
             int(k): v for k, v in cluster_data["clustered_files"].items()
         }
-        self.filename_to_idx = {fn: i for i, fn in enumerate(self.filenames)}
+        self.filename_to_idx = dict(zip(self.filenames, range(len(self.filenames))))
 
         # 계층 정보
         self.hierarchy_info = cluster_data.get("hierarchy_info", {})
@@ -124,11 +112,18 @@ class ClusterTagger:
         if len(cluster_indices) <= top_k:
             return cluster_files
 
+        # 임베딩이 L2 정규화되어 있으므로 코사인 거리 합은 n - x·(Σy)
+        # (n x n 거리 행렬 없이 행렬-벡터 곱 한 번으로 계산)
         cluster_embeddings = self.embeddings[cluster_indices]
-        distances = pairwise_distances(cluster_embeddings, metric="cosine")
-        distance_sums = distances.sum(axis=1)
+        distance_sums = len(cluster_indices) - cluster_embeddings @ (
+            cluster_embeddings.sum(axis=0)
+        )
 
-        top_medoid_indices = distance_sums.argsort()[:top_k]
+        # 전체 정렬 대신 상위 top_k만 분할한 뒤 그 안에서만 정렬
+        candidate_indices = np.argpartition(distance_sums, top_k - 1)[:top_k]
+        top_medoid_indices = candidate_indices[
+            np.argsort(distance_sums[candidate_indices])
+        ]
         return [cluster_files[i] for i in top_medoid_indices]
 
     def _encode_image(self, image_path: Path) -> str:
@@ -154,23 +149,51 @@ class ClusterTagger:
         Returns:
             str: 추출된 키워드
         """
-        stem = Path(filename).stem
-        return stem.split("_", 1)[1] if "_" in stem else ""
+        return extract_card_keyword(filename)
 
-    def _tag_cluster_with_llm(
+    def _is_small_cluster(self, cluster_id: int, medoid_files: List[str]) -> bool:
+        """LLM 호출 없이 키워드로 태깅할 작은 클러스터인지 판단.
+
+        카드가 몇 장뿐인 클러스터는 카드 키워드 자체가 공통 주제이므로
+        API 왕복 비용을 들이지 않고 키워드로 태그를 구성합니다.
+
+        Args:
+            cluster_id: 클러스터 ID
+            medoid_files: 대표 이미지 파일명들
+
+        Returns:
+            bool: 키워드 태깅 대상 여부
+        """
+        min_llm_cluster_size = self.config.get("min_llm_cluster_size", 0)
+        cluster_size = len(self.clustered_files.get(cluster_id, []))
+        return bool(medoid_files) and cluster_size < min_llm_cluster_size
+
+    def _tag_cluster_from_keywords(self, medoid_files: List[str]) -> List[str]:
+        """대표 이미지 파일명의 키워드로 클러스터 태그 생성.
+
+        Args:
+            medoid_files: 대표 이미지 파일명들
+
+        Returns:
+            List[str]: 중복을 제거한 최대 3개의 키워드 태그
+        """
+        keywords = (self._extract_keyword(filename) for filename in medoid_files)
+        return list(dict.fromkeys(keyword for keyword in keywords if keyword))[:3]
+
+    def _build_tagging_request(
         self, cluster_id: int, medoid_files: List[str]
-    ) -> List[str]:
-        """OpenAI Vision API를 사용한 클러스터 태깅.
+    ) -> Optional[Dict]:
+        """클러스터 태깅용 Chat Completions 요청 본문 생성.
 
         Args:
             cluster_id: 클러스터 ID
             medoid_files: 대표 이미지 파일명들
 
         Returns:
-            List[str]: 생성된 태그들
+            Optional[Dict]: 요청 본문 (대표 이미지가 없으면 None)
         """
         if not medoid_files:
-            return []
+            return None
 
         # 계층 정보
         hierarchy_info = self.cluster_hierarchy.get(str(cluster_id), {})
@@ -232,14 +255,32 @@ class ClusterTagger:
             },
         }
 
+        return {
+            "model": self.config["openai_model"],
+            "messages": [{"role": "user", "content": content}],
+            "response_format": schema,
+            "temperature": self.config["openai_temperature"],
+            "max_tokens": 200,
+        }
+
+    def _tag_cluster_with_llm(
+        self, cluster_id: int, medoid_files: List[str]
+    ) -> List[str]:
+        """OpenAI Vision API를 사용한 클러스터 태깅.
+
+        Args:
+            cluster_id: 클러스터 ID
+            medoid_files: 대표 이미지 파일명들
+
+        Returns:
+            List[str]: 생성된 태그들
+        """
+        request_body = self._build_tagging_request(cluster_id, medoid_files)
+        if request_body is None:
+            return []
+
         try:
-            response = self.client.chat.completions.create(
-                model=self.config["openai_model"],
-                messages=[{"role": "user", "content": content}],
-                response_format=schema,
-                temperature=self.config["openai_temperature"],
-                max_tokens=200,
-            )
+            response = self.client.chat.completions.create(**request_body)
 
             result = json.loads(response.choices[0].message.content)
             return result.get("topics", [])
@@ -250,9 +291,14 @@ class ClusterTagger:
     def tag_all_clusters(self) -> Dict[int, List[str]]:
         """모든 클러스터에 대해 태깅 수행.
 
+        config의 use_batch_api가 True이면 Batch API로 일괄 처리합니다.
+
         Returns:
             Dict[int, List[str]]: 클러스터 ID별 태그 리스트
         """
+        if self.config.get("use_batch_api", False):
+            return self.tag_all_clusters_batch()
+
         cluster_tags = {}
         delay = self.config["request_delay"]
 
@@ -263,6 +309,10 @@ class ClusterTagger:
                 cluster_tags[cluster_id] = []
                 continue
 
+            if self._is_small_cluster(cluster_id, medoid_files):
+                cluster_tags[cluster_id] = self._tag_cluster_from_keywords(medoid_files)
+                continue
+
             tags = self._tag_cluster_with_llm(cluster_id, medoid_files)
             cluster_tags[cluster_id] = tags
 
@@ -271,6 +321,120 @@ class ClusterTagger:
 
         return cluster_tags
 
+    def tag_all_clusters_batch(self) -> Dict[int, List[str]]:
+        """OpenAI Batch API로 모든 클러스터 태깅을 일괄 수행.
+
+        클러스터별 요청을 JSONL 파일로 모아 한 번에 업로드하고, 배치 작업이
+        끝날 때까지 상태를 폴링한 뒤 custom_id로 결과를 클러스터에 매칭합니다.
+        오프라인 파이프라인이므로 요청 간 지연 없이 비용이 절반인 배치 처리를 사용합니다.
+
+        Returns:
+            Dict[int, List[str]]: 클러스터 ID별 태그 리스트
+
+        Raises:
+            RuntimeError: 배치 작업이 완료되지 않고 종료된 경우
+        """
+        cluster_tags = {cluster_id: [] for cluster_id in self.clustered_files}
+        batch_input_path = Path(
+            self.config.get("batch_input_path", "cluster_tagging_batch.jsonl")
+        )
+        batch_input_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 클러스터별 요청을 JSONL로 기록 (응답 실패시 키워드 태깅용 대표 이미지 보관)
+        pending_medoids: Dict[int, List[str]] = {}
+        request_count = 0
+        with open(batch_input_path, "w", encoding="utf-8") as f:
+            for cluster_id in tqdm(self.clustered_files.keys(), desc="배치 요청 생성"):
+                medoid_files = self._find_top_medoids(cluster_id)
+                if self._is_small_cluster(cluster_id, medoid_files):
+                    cluster_tags[cluster_id] = self._tag_cluster_from_keywords(
+                        medoid_files
+                    )
+                    continue
+
+                request_body = self._build_tagging_request(cluster_id, medoid_files)
+                if request_body is None:
+                    continue
+
+                pending_medoids[cluster_id] = medoid_files
+
+                line = {
+                    "custom_id": f"cluster-{cluster_id}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": request_body,
+                }
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+                request_count += 1
+
+        if request_count == 0:
+            return cluster_tags
+
+        # 배치 입력 파일 업로드 및 배치 작업 생성
+        with open(batch_input_path, "rb") as f:
+            batch_file = self.client.files.create(file=f, purpose="batch")
+
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        print(f"배치 작업 생성: {batch.id} ({request_count}개 요청)")
+
+        # 배치 작업 완료 대기
+        poll_interval = self.config.get("batch_poll_interval", 30)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"배치 작업 실패: {batch.id} (상태: {batch.status})")
+
+        # 성공 결과 파일과 오류 파일의 각 줄을 custom_id로 클러스터에 매칭
+        result_lines = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                result_lines.extend(
+                    self.client.files.content(file_id).text.splitlines()
+                )
+
+        for line in result_lines:
+            if not line.strip():
+                continue
+
+            try:
+                result = json.loads(line)
+                cluster_id = int(result["custom_id"].split("-", 1)[1])
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                print(f"배치 결과 줄 파싱 실패: {e}")
+                continue
+
+            medoid_files = pending_medoids.pop(cluster_id, None)
+            if medoid_files is None:
+                continue
+
+            try:
+                response = result.get("response") or {}
+                if result.get("error") or response.get("status_code") != 200:
+                    raise RuntimeError(
+                        result.get("error")
+                        or f"status_code={response.get('status_code')}"
+                    )
+
+                message = response["body"]["choices"][0]["message"]["content"]
+                cluster_tags[cluster_id] = json.loads(message).get("topics", [])
+
+            except Exception as e:
+                print(f"클러스터 {cluster_id} 배치 태깅 실패, 키워드로 대체: {e}")
+                cluster_tags[cluster_id] = self._tag_cluster_from_keywords(medoid_files)
+
+        # 결과 줄이 없는 클러스터도 키워드 태그로 대체
+        for cluster_id, medoid_files in pending_medoids.items():
+            print(f"클러스터 {cluster_id} 배치 결과 없음, 키워드로 대체")
+            cluster_tags[cluster_id] = self._tag_cluster_from_keywords(medoid_files)
+
+        return cluster_tags
+
     def save_cluster_tags(
         self, cluster_tags: Dict[int, List[str]], output_path: str
     ) -> None:
@@ -394,17 +558,17 @@ class ClusterTagger:
                 ):
                     cluster_max_similarities[cluster_id] = max_sim
 
-            # 임계값 이상 클러스터 선택
-            candidates = [
-                (cluster_id, sim)
-                for cluster_id, sim in cluster_max_similarities.items()
-                if sim >= similarity_threshold
-            ]
-
-            candidates.sort(key=lambda x: x[1], reverse=True)
-            preferred_categories = [
-                cluster_id for cluster_id, _ in candidates[:required_cluster_count]
-            ]
+            # 임계값 이상 클러스터 중 유사도 상위 required_cluster_count개 부분 선택
+            candidates = heapq.nlargest(
+                required_cluster_count,
+                (
+                    (cluster_id, sim)
+                    for cluster_id, sim in cluster_max_similarities.items()
+                    if sim >= similarity_threshold
+                ),
+                key=lambda x: x[1],
+            )
+            preferred_categories = [cluster_id for cluster_id, _ in candidates]
 
             persona["persona"]["preferred_category_types"] = preferred_categories
 
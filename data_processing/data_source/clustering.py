@@ -9,6 +9,8 @@ from sklearn.metrics import silhouette_score
 from sklearn.preprocessing import normalize
 from tqdm import tqdm
 
+from .embedding_store import fuse_embeddings, load_fused_embeddings
+
 plt.rcParams["font.family"] = ["DejaVu Sans", "sans-serif"]
 plt.rcParams["axes.unicode_minus"] = False
 
@@ -58,16 +60,17 @@ class SphericalKMeans:
         centers[0] = X[rng.randint(n_samples)]
         centers[0] = centers[0] / np.linalg.norm(centers[0])
 
+        # 각 샘플에서 가장 가까운 중심점까지의 거리를 유지하며 새 중심점만 반영
+        distances = 1 - X @ centers[0]
+
         for c_id in range(1, self.n_clusters):
-            distances = np.array(
-                [min([1 - np.dot(x, center) for center in centers[:c_id]]) for x in X]
-            )
             probs = distances / distances.sum()
             cumprobs = probs.cumsum()
             idx = np.searchsorted(cumprobs, rng.rand())
 
             centers[c_id] = X[idx]
             centers[c_id] = centers[c_id] / np.linalg.norm(centers[c_id])
+            distances = np.minimum(distances, 1 - X @ centers[c_id])
 
         return centers
 
@@ -129,12 +132,7 @@ class SphericalKMeans:
                 labels = self._assign_clusters(X_normalized, centers)
                 new_centers = self._update_centers(X_normalized, labels)
 
-                center_shift = np.max(
-                    [
-                        1 - np.dot(centers[k], new_centers[k])
-                        for k in range(self.n_clusters)
-                    ]
-                )
+                center_shift = np.max(1 - np.einsum("ij,ij->i", centers, new_centers))
                 centers = new_centers
 
                 if center_shift < 1e-4:
@@ -179,30 +177,29 @@ class Clusterer:
             config: 설정 딕셔너리
         """
         if embedding_data is not None:
-            self.data = embedding_data
+            self.filenames = embedding_data["filenames"]
+            img_embeddings = np.asarray(
+                embedding_data["image_embeddings"], dtype=np.float32
+            )
+            txt_embeddings = np.asarray(
+                embedding_data["text_embeddings"], dtype=np.float32
+            )
+            self.config = config or {}
+
+            # 임베딩 융합 (config에서 이미지 가중치 가져오기)
+            self.embeddings = fuse_embeddings(
+                img_embeddings, txt_embeddings, self.config["image_weight"]
+            )
         elif embeddings_path:
-            with open(embeddings_path, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
+            self.config = config or {}
+
+            # 융합 결과는 디스크에 캐시되어 재실행 시 재계산 생략
+            self.filenames, self.embeddings = load_fused_embeddings(
+                embeddings_path, self.config["image_weight"]
+            )
         else:
             raise ValueError("embeddings_path 또는 embedding_data 필요")
 
-        self.config = config or {}
-        self.filenames = self.data["filenames"]
-
-        # 임베딩 융합
-        img_embeddings = np.array(self.data["image_embeddings"])
-        txt_embeddings = np.array(self.data["text_embeddings"])
-
-        img_normalized = normalize(img_embeddings, norm="l2")
-        txt_normalized = normalize(txt_embeddings, norm="l2")
-
-        # config에서 이미지 가중치 가져오기
-        img_weight = self.config["image_weight"]
-        self.embeddings = (
-            img_weight * img_normalized + (1 - img_weight) * txt_normalized
-        )
-        self.embeddings = normalize(self.embeddings, norm="l2")
-
     def _find_optimal_clusters(
         self, X: np.ndarray, min_k: int = 2, max_k: int = 30
     ) -> int:
@@ -0,0 +1,193 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+
+def _array_paths(embeddings_path: str) -> Tuple[Path, Path, Path]:
+    """임베딩 JSON 경로에 대응하는 .npy/파일명 경로 반환.
+
+    Args:
+        embeddings_path: 임베딩 JSON 파일 경로
+
+    Returns:
+        Tuple[Path, Path, Path]: (파일명_JSON, 이미지_임베딩_npy, 텍스트_임베딩_npy)
+    """
+    path = Path(embeddings_path)
+    return (
+        path.with_suffix(".filenames.json"),
+        path.with_suffix(".image.npy"),
+        path.with_suffix(".text.npy"),
+    )
+
+
+def save_embedding_arrays(
+    filenames: List[str],
+    image_embeddings: np.ndarray,
+    text_embeddings: np.ndarray,
+    embeddings_path: str,
+) -> None:
+    """임베딩을 JSON과 함께 .npy 배열로 저장.
+
+    JSON 파싱 없이 memory-map으로 바로 읽을 수 있도록 float32 배열과
+    파일명 목록을 임베딩 JSON 옆에 저장합니다.
+
+    Args:
+        filenames: 파일명 리스트
+        image_embeddings: 이미지 임베딩 배열
+        text_embeddings: 텍스트 임베딩 배열
+        embeddings_path: 임베딩 JSON 파일 경로
+    """
+    filenames_path, image_path, text_path = _array_paths(embeddings_path)
+
+    np.save(image_path, np.asarray(image_embeddings, dtype=np.float32))
+    np.save(text_path, np.asarray(text_embeddings, dtype=np.float32))
+
+    with open(filenames_path, "w", encoding="utf-8") as f:
+        json.dump(filenames, f, ensure_ascii=False)
+
+
+def load_embedding_arrays(
+    embeddings_path: str,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """임베딩 파일명과 이미지/텍스트 임베딩 배열 로드.
+
+    임베딩 JSON보다 오래되지 않은 .npy 파일이 있으면 memory-map(읽기 전용)으로
+    로드하고, 없으면 기존 JSON 파일을 파싱합니다.
+
+    Args:
+        embeddings_path: 임베딩 JSON 파일 경로
+
+    Returns:
+        Tuple: (파일명_리스트, 이미지_임베딩_배열, 텍스트_임베딩_배열)
+    """
+    json_path = Path(embeddings_path)
+    filenames_path, image_path, text_path = _array_paths(embeddings_path)
+    array_files = (filenames_path, image_path, text_path)
+
+    if all(p.exists() for p in array_files) and (
+        not json_path.exists()
+        or min(p.stat().st_mtime for p in array_files) >= json_path.stat().st_mtime
+    ):
+        try:
+            with open(filenames_path, "r", encoding="utf-8") as f:
+                filenames = json.load(f)
+            image_embeddings = np.load(image_path, mmap_mode="r")
+            text_embeddings = np.load(text_path, mmap_mode="r")
+
+            if len(filenames) == len(image_embeddings) == len(text_embeddings):
+                return filenames, image_embeddings, text_embeddings
+
+        except (OSError, ValueError) as e:
+            print(f".npy 임베딩 로드 실패, JSON으로 대체: {e}")
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        embedding_data = json.load(f)
+
+    return (
+        embedding_data["filenames"],
+        np.asarray(embedding_data["image_embeddings"], dtype=np.float32),
+        np.asarray(embedding_data["text_embeddings"], dtype=np.float32),
+    )
+
+
+def _row_norms(X: np.ndarray) -> np.ndarray:
+    """행별 L2 노름 계산 (0인 행은 1로 대체).
+
+    Args:
+        X: 입력 배열
+
+    Returns:
+        np.ndarray: (n, 1) 형태의 노름 배열
+    """
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return norms
+
+
+def fuse_embeddings(
+    image_embeddings: np.ndarray, text_embeddings: np.ndarray, image_weight: float
+) -> np.ndarray:
+    """이미지/텍스트 임베딩을 가중 융합하여 L2 정규화.
+
+    각 임베딩을 정규화한 뒤 가중합하고 다시 정규화합니다. 결과는 미리 할당한
+    하나의 float32 버퍼에서 in-place로 계산하여 중간 복사본을 줄입니다.
+
+    Args:
+        image_embeddings: 이미지 임베딩 배열
+        text_embeddings: 텍스트 임베딩 배열
+        image_weight: 이미지 가중치 (0.0 ~ 1.0)
+
+    Returns:
+        np.ndarray: 융합된 (n, d) float32 임베딩
+    """
+    fused = np.empty(image_embeddings.shape, dtype=np.float32)
+
+    np.divide(image_embeddings, _row_norms(image_embeddings), out=fused)
+    fused *= image_weight
+    fused += text_embeddings * ((1 - image_weight) / _row_norms(text_embeddings))
+    fused /= _row_norms(fused)
+
+    return fused
+
+
+def load_fused_embeddings(
+    embeddings_path: str, image_weight: float
+) -> Tuple[List[str], np.ndarray]:
+    """융합·정규화된 임베딩을 디스크 캐시에서 로드하거나 계산 후 저장.
+
+    캐시 키는 원본 임베딩 파일의 수정 시각과 이미지 가중치로 만들어, 원본이
+    바뀌거나 가중치가 달라지면 자동으로 다시 계산합니다. 캐시 파일은 복사 없이
+    memory-map으로 로드하므로 반환 배열은 항상 읽기 전용입니다.
+
+    Args:
+        embeddings_path: 임베딩 JSON 파일 경로
+        image_weight: 이미지 가중치 (0.0 ~ 1.0)
+
+    Returns:
+        Tuple: (파일명_리스트, 융합된 임베딩 배열 (읽기 전용))
+    """
+    json_path = Path(embeddings_path)
+    filenames_path, image_path, _ = _array_paths(embeddings_path)
+    source_path = json_path if json_path.exists() else image_path
+
+    cache_key = hashlib.sha256(
+        f"{source_path.stat().st_mtime}:{image_weight}".encode()
+    ).hexdigest()[:16]
+    fused_path = json_path.with_suffix(f".fused.{cache_key}.npy")
+
+    if fused_path.exists() and filenames_path.exists():
+        try:
+            with open(filenames_path, "r", encoding="utf-8") as f:
+                filenames = json.load(f)
+            fused = np.load(fused_path, mmap_mode="r")
+
+            if len(filenames) == len(fused):
+                return filenames, fused
+
+        except (OSError, ValueError) as e:
+            print(f"융합 임베딩 캐시 로드 실패, 다시 계산: {e}")
+
+    filenames, image_embeddings, text_embeddings = load_embedding_arrays(
+        embeddings_path
+    )
+    fused = fuse_embeddings(image_embeddings, text_embeddings, image_weight)
+
+    try:
+        # 이전 키의 캐시 파일 정리 후 저장
+        for stale_path in json_path.parent.glob(f"{json_path.stem}.fused.*.npy"):
+            stale_path.unlink()
+        np.save(fused_path, fused)
+
+        # 캐시와 같은 시점의 파일명 목록으로 갱신
+        with open(filenames_path, "w", encoding="utf-8") as f:
+            json.dump(filenames, f, ensure_ascii=False)
+
+    except OSError as e:
+        print(f"융합 임베딩 캐시 저장 실패: {e}")
+
+    # 캐시 로드 경로와 동일하게 읽기 전용으로 반환
+    fused.flags.writeable = False
+    return filenames, fused
@@ -11,6 +11,9 @@ from PIL import Image
 from tqdm import tqdm
 from transformers import AutoModel, AutoProcessor
 
+from .card_filename import extract_card_keyword
+from .embedding_store import save_embedding_arrays
+
 
 class CLIPEncoder:
     """CLIP 모델을 사용한 이미지-텍스트 임베딩 생성기.
@@ -83,10 +86,7 @@ class CLIPEncoder:
         Returns:
             str: 추출된 키워드 (없으면 빈 문자열)
         """
-        stem = Path(filename).stem
-        if "_" not in stem:
-            return ""
-        return stem.split("_", 1)[1]
+        return extract_card_keyword(filename)
 
     def encode_single(
         self, image_path: str, text: str
@@ -170,6 +170,8 @@ class CLIPEncoder:
     ) -> None:
         """임베딩 결과를 JSON 파일로 저장.
 
+        후속 단계가 JSON 파싱 없이 로드할 수 있도록 .npy 배열도 함께 저장합니다.
+
         Args:
             filenames: 파일명 리스트
             image_embeddings: 이미지 임베딩 배열
@@ -187,6 +189,8 @@ class CLIPEncoder:
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(embedding_data, f, ensure_ascii=False, indent=2)
 
+        save_embedding_arrays(filenames, image_embeddings, text_embeddings, output_path)
+
         print(f"Embeddings saved to {output_path}")
 
     def process_and_save(
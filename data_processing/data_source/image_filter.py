@@ -2,10 +2,12 @@ import re
 import shutil
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional
 
 from tqdm import tqdm
 
+from .card_filename import extract_card_keyword
+
 
 class ImageFilter:
     """AAC 이미지 필터링 시스템.
@@ -737,60 +739,70 @@ class ImageFilter:
         self._compile_patterns()
 
     def _compile_patterns(self):
-        """모든 키워드의 정규표현식 패턴을 미리 컴파일.
+        """카테고리별 키워드를 하나의 정규표현식 패턴으로 미리 컴파일.
 
-        성능 향상을 위해 모든 키워드 패턴을 한 번에 컴파일하여 저장합니다.
+        키워드마다 패턴을 따로 검사하지 않도록 카테고리의 모든 키워드를
+        하나의 교대(alternation) 패턴으로 합쳐, 카테고리당 한 번의 탐색으로 매칭합니다.
         """
-        all_keyword_sets = [
-            self.inappropriate_keywords,
-            self.medical_technical_keywords,
-            self.academic_scientific_keywords,
-            self.cultural_specific_keywords,
-            self.administrative_legal_keywords,
-            self.location_keywords,
-            self.tools_objects_keywords,
-            self.concepts_keywords,
-            self.miscellaneous_keywords,
+        self._filter_categories = [
+            ("inappropriate", self.inappropriate_keywords),
+            ("medical_technical", self.medical_technical_keywords),
+            ("academic_scientific", self.academic_scientific_keywords),
+            ("cultural_specific", self.cultural_specific_keywords),
+            ("administrative_legal", self.administrative_legal_keywords),
+            ("locations", self.location_keywords),
+            ("tools_objects", self.tools_objects_keywords),
+            ("concepts", self.concepts_keywords),
+            ("miscellaneous", self.miscellaneous_keywords),
         ]
 
-        for keyword_set in all_keyword_sets:
+        for category_name, keyword_set in self._filter_categories:
+            korean_keywords = []
+            english_keywords = []
+
             for keyword in keyword_set:
                 keyword_lower = keyword.lower()
 
-                # 한글 키워드 처리
                 if re.search(r"[ㄱ-ㅎ가-힣]", keyword_lower):
-                    pattern = (
-                        r"(?<![가-힣])" + re.escape(keyword_lower) + r"(?![가-힣])"
-                    )
-                # 영어 키워드 처리
+                    korean_keywords.append(re.escape(keyword_lower))
                 else:
-                    pattern = r"\b" + re.escape(keyword_lower) + r"\b"
+                    english_keywords.append(re.escape(keyword_lower))
+
+            alternatives = []
 
-                # 패턴을 미리 컴파일해서 저장
-                self._compiled_patterns[keyword_lower] = re.compile(
-                    pattern, re.IGNORECASE
+            # 한글 키워드 처리
+            if korean_keywords:
+                korean_keywords.sort(key=len, reverse=True)
+                alternatives.append(
+                    r"(?<![가-힣])(?:" + "|".join(korean_keywords) + r")(?![가-힣])"
                 )
 
-    def _contains_word(self, text: str, keywords: Set[str]) -> bool:
-        """미리 컴파일된 패턴을 사용하여 키워드 매칭.
+            # 영어 키워드 처리
+            if english_keywords:
+                english_keywords.sort(key=len, reverse=True)
+                alternatives.append(r"\b(?:" + "|".join(english_keywords) + r")\b")
+
+            if alternatives:
+                self._compiled_patterns[category_name] = re.compile(
+                    "|".join(alternatives), re.IGNORECASE
+                )
+
+    def _contains_word(self, text: str, category_name: str) -> bool:
+        """미리 컴파일된 카테고리 패턴을 사용하여 키워드 매칭.
 
         Args:
-            text: 검사할 텍스트
-            keywords: 키워드 집합
+            text: 검사할 텍스트 (소문자로 변환된 값)
+            category_name: 필터링 카테고리 이름
 
         Returns:
             bool: 키워드 발견 여부
         """
-        text_lower = text.lower()
-
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
+        compiled_pattern = self._compiled_patterns.get(category_name)
+        if compiled_pattern is None:
+            return False
 
-            compiled_pattern = self._compiled_patterns[keyword_lower]
-            if compiled_pattern.search(text_lower):
-                return True
-
-        return False
+        # 호출부에서 소문자로 변환한 텍스트를 받으므로 다시 변환하지 않음
+        return compiled_pattern.search(text) is not None
 
     def _extract_keyword(self, filename: str) -> str:
         """파일명에서 키워드 추출.
@@ -803,10 +815,7 @@ class ImageFilter:
         Returns:
             str: 추출된 키워드
         """
-        stem = Path(filename).stem
-        if "_" not in stem:
-            return ""
-        return stem.split("_", 1)[1].strip()
+        return extract_card_keyword(filename).strip()
 
     def _should_filter(self, keyword: str) -> str:
         """키워드가 필터링 대상인지 판단.
@@ -817,31 +826,24 @@ class ImageFilter:
         Returns:
             str: 필터링 사유 (빈 문자열이면 필터링 안함)
         """
-        keyword_lower = keyword.lower()
+        keyword_stripped = keyword.strip()
 
-        if not keyword.strip():
+        if not keyword_stripped:
             return "empty_keyword"
 
-        if len(keyword.strip()) == 1 and keyword.isalpha() and keyword.isascii():
+        if len(keyword_stripped) == 1 and keyword.isalpha() and keyword.isascii():
             return "single_english_letter"
 
-        categories = [
-            ("inappropriate", self.inappropriate_keywords),
-            ("medical_technical", self.medical_technical_keywords),
-            ("academic_scientific", self.academic_scientific_keywords),
-            ("cultural_specific", self.cultural_specific_keywords),
-            ("administrative_legal", self.administrative_legal_keywords),
-            ("locations", self.location_keywords),
-            ("tools_objects", self.tools_objects_keywords),
-            ("concepts", self.concepts_keywords),
-            ("miscellaneous", self.miscellaneous_keywords),
-        ]
-
-        for category_name, keywords in categories:
-            if self._contains_word(keyword_lower, keywords):
-                return category_name
-
-        return ""
+        # 처음 매칭된 카테고리에서 바로 탐색 종료
+        keyword_lower = keyword.lower()
+        return next(
+            (
+                category_name
+                for category_name, _ in self._filter_categories
+                if self._contains_word(keyword_lower, category_name)
+            ),
+            "",
+        )
 
     def analyze_images(self) -> Dict[str, List[str]]:
         """이미지 분석 및 필터링 대상 파일 분류.
@@ -856,18 +858,17 @@ class ImageFilter:
         filtered_files: Dict[str, List[str]] = defaultdict(list)
         keyword_to_files: Dict[str, List[str]] = defaultdict(list)
 
+        # 키워드별로 파일을 먼저 묶어 같은 키워드는 한 번만 검사
         for filename in tqdm(png_files, desc="Analyzing images"):
-            keyword = self._extract_keyword(filename)
+            keyword_to_files[self._extract_keyword(filename)].append(filename)
+
+        for keyword, files in keyword_to_files.items():
             filter_reason = self._should_filter(keyword)
 
             if filter_reason:
-                filtered_files[filter_reason].append(filename)
+                filtered_files[filter_reason].extend(files)
 
-            if keyword:
-                keyword_to_files[keyword].append(filename)
-
-        for keyword, files in keyword_to_files.items():
-            if len(files) > 1:
+            if keyword and len(files) > 1:
                 filtered_files["duplicates"].extend(files[1:])
 
         return dict(filtered_files)
@@ -888,7 +889,7 @@ class ImageFilter:
 
         filtered_files = self.analyze_images()
         all_files_to_move = list(
-            set(file for files in filtered_files.values() for file in files)
+            {file for files in filtered_files.values() for file in files}
         )
 
         if not all_files_to_move:
@@ -24,10 +24,16 @@ DATASET_CONFIG = {
     "openai_model": "gpt-4o-2024-08-06",
     "openai_temperature": 0.2,  # 일관된 태깅을 위해 낮게 설정
     "request_delay": 1.0,
+    "use_batch_api": False,  # True이면 Batch API로 일괄 태깅 (50% 비용, 최대 24시간)
+    "batch_poll_interval": 30,  # 배치 상태 확인 간격 (초)
+    "batch_input_path": str(
+        PROJECT_ROOT / "dataset" / "processed" / "cluster_tagging_batch.jsonl"
+    ),
     # GPU/CPU 설정
     "device": "auto",
     # 클러스터 태깅
     "cluster_medoid_count": 5,  # 더 정확한 태깅 위함.
+    "min_llm_cluster_size": 3,  # 이보다 작은 클러스터는 LLM 없이 카드 키워드로 태깅
     # 유사도 모델
     "similarity_model": "Snowflake/snowflake-arctic-embed-l",
     # 선호 카테고리 할당